@@ -69,9 +69,22 @@ class Cache:
         self.line_size = line_size if line_size > 0 else 1
         self.associativity = associativity
         self.num_sets = max(1, num_blocks // associativity)
+        # shift amounts for decode when line_size and num_sets are both
+        # powers of two (the usual case); None means divide instead
+        ls, ns = self.line_size, self.num_sets
+        if ls & (ls - 1) or ns & (ns - 1):
+            self._decode_shifts = None
+        else:
+            self._decode_shifts = ((ls - 1).bit_length(), (ns - 1).bit_length())
         self.write_policy = write_policy
         self.write_miss_policy = write_miss_policy
         self._replacement_name = replacement
+        # incremented whenever any block's (valid, tag) changes, so observers
+        # can tell cheaply whether the cache-to-memory mapping moved
+        self.tag_version = 0
+        # number of blocks with dirty set; change dirty bits through
+        # set_dirty so this stays exact
+        self.dirty_count = 0
         self.replacement_policy_objs: List[object] = []
         for _ in range(self.num_sets):
             if replacement == "LRU":
@@ -99,9 +112,19 @@ class Cache:
                     b.data = [0]
                 row.append(b)
             self.sets.append(row)
-
-    def _decode(self, address: int):
+        # the same blocks in row-major order (index = set * associativity + way),
+        # for callers that walk every block and would otherwise index sets[s][w]
+        self.flat_blocks: List[CacheBlock] = [b for row in self.sets for b in row]
+        # per-set index: tag -> way of the valid block holding it, kept in step
+        # with every fill, replacement and reset so lookups need no way scan
+        self.tag_ways: List[dict] = [{} for _ in range(self.num_sets)]
+
+    def decode(self, address: int):
         """Decode address into (set_index, tag)."""
+        shifts = self._decode_shifts
+        if shifts is not None:
+            block_addr = address >> shifts[0]
+            return block_addr & (self.num_sets - 1), block_addr >> shifts[1]
 
         bs = self.line_size if self.line_size > 0 else 1
         block_addr = address // bs
@@ -112,6 +135,10 @@ class Cache:
         tag = block_addr // self.num_sets
         return set_index, tag
 
+    def find_way(self, set_index: int, tag: int) -> Optional[int]:
+        """Return the way of the valid block holding `tag` in `set_index`, or None."""
+        return self.tag_ways[set_index].get(tag)
+
     def access(self, address: int, is_write: bool = False, write_miss_policy: Optional[str] = None, write_value: Optional[int] = None):
         """Perform a cache access.
 
@@ -127,49 +154,50 @@ class Cache:
         if write_miss_policy is None:
             write_miss_policy = self.write_miss_policy
 
-        set_index, tag = self._decode(address)
+        set_index, tag = self.decode(address)
         cache_set = self.sets[set_index]
 
-        # search for hit
+        # search for hit through the per-set tag index
         # wi = way-index
-        for wi, block in enumerate(cache_set):
-            if block.valid and block.tag == tag:
-                # hit: update timestamps and notify policy
-                now = time.time()
-                block.last_access_time = now
+        wi = self.tag_ways[set_index].get(tag)
+        if wi is not None:
+            block = cache_set[wi]
+            # hit: update timestamps and notify policy
+            now = time.time()
+            block.last_access_time = now
+            try:
+                self.replacement_policy_objs[set_index].access(wi)
+            except Exception:
+                #ignore if method missing
+                pass
+
+            mem_read = False
+            mem_write = False
+            if is_write:
+                # compute byte offset within line
                 try:
-                    self.replacement_policy_objs[set_index].access(wi)
+                    offset = int(address) % int(self.line_size)
                 except Exception:
-                    #ignore if method missing
-                    pass
-
-                mem_read = False
-                mem_write = False
-                if is_write:
-                    # compute byte offset within line
+                    offset = 0
+                    # on write, update block's data if available
                     try:
-                        offset = int(address) % int(self.line_size)
+                        if block.data is None:
+                            block.data = [0 for _ in range(self.line_size)]
+                        # if a write_value was passed, assign it to the byte offset
+                        if write_value is not None:
+                            try:
+                                block.data[offset] = int(write_value)
+                            except Exception:
+                                pass
                     except Exception:
-                        offset = 0
-                        # on write, update block's data if available
-                        try:
-                            if block.data is None:
-                                block.data = [0 for _ in range(self.line_size)]
-                            # if a write_value was passed, assign it to the byte offset
-                            if write_value is not None:
-                                try:
-                                    block.data[offset] = int(write_value)
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                    if self.write_policy == "write-back":
-                        block.dirty = True
-                        mem_write = False
-                    else:
-                        # write-through, so immediate mem write
-                        mem_write = True
-                return True, set_index, wi, None, mem_read, mem_write
+                        pass
+                if self.write_policy == "write-back":
+                    self.set_dirty(block, True)
+                    mem_write = False
+                else:
+                    # write-through, so immediate mem write
+                    mem_write = True
+            return True, set_index, wi, None, mem_read, mem_write
 
         # miss handling
         if is_write and write_miss_policy in ("write-no-allocate"):
@@ -183,7 +211,9 @@ class Cache:
                 now = time.time()
                 block.tag = tag
                 block.valid = True
-                block.dirty = is_write and (self.write_policy == "write-back")
+                self.tag_ways[set_index][tag] = wi
+                self.tag_version += 1
+                self.set_dirty(block, is_write and (self.write_policy == "write-back"))
                 block.last_access_time = now
                 block.load_time = now
                 # initialize block data container
@@ -248,9 +278,14 @@ class Cache:
 
         # place the new block into victim slot
         now = time.time()
+        tag_ways = self.tag_ways[set_index]
+        if victim.valid and tag_ways.get(victim.tag) == victim_index:
+            del tag_ways[victim.tag]
         victim.tag = tag
         victim.valid = True
-        victim.dirty = is_write and (self.write_policy == "write-back")
+        tag_ways[tag] = victim_index
+        self.tag_version += 1
+        self.set_dirty(victim, is_write and (self.write_policy == "write-back"))
         victim.last_access_time = now
         victim.load_time = now
         try:
@@ -277,6 +312,13 @@ class Cache:
             mem_write = True
         return False, set_index, victim_index, evicted, mem_read, mem_write
 
+    def set_dirty(self, block: CacheBlock, dirty: bool):
+        """Set `block.dirty`, keeping dirty_count in step."""
+        dirty = bool(dirty)
+        if block.dirty != dirty:
+            self.dirty_count += 1 if dirty else -1
+            block.dirty = dirty
+
     def reset(self):
         """Clear cache contents and reset replacement policies.
         """
@@ -288,6 +330,10 @@ class Cache:
                 b.dirty = False
                 b.last_access_time = 0.0
                 b.load_time = 0.0
+        for tag_ways in self.tag_ways:
+            tag_ways.clear()
+        self.dirty_count = 0
+        self.tag_version += 1
 
         for p in self.replacement_policy_objs:
             try:
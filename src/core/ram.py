@@ -8,10 +8,11 @@ cache misses can read/write the backing memory.
 Parameters:
 - RAM(size_bytes, line_size)
 - read(address) -> returns stored value or 0
+- read_block(base, n) -> list of the n values starting at base
 - write(address, value=0) -> stores value at address
 - reset() -> clears memory
 """
-from typing import Optional
+from typing import List, Optional
 
 
 class RAM:
@@ -45,6 +46,19 @@ class RAM:
         a = self._clamp_addr(a)
         return self.storage.get(a, 0)
 
+    def read_block(self, base: int, n: int) -> List[int]:
+        """Read `n` consecutive values starting at `base` in one call.
+
+        Equivalent to `[read(a) for a in range(base, base + n)]` but checks
+        the range once. Raises IndexError if any address is out of range.
+        """
+        b = self._clamp_addr(int(base))
+        n = max(0, int(n))
+        if n and b + n > self.size:
+            raise IndexError(f"address {b + n - 1} out of range [0, {self.size - 1}]")
+        get = self.storage.get
+        return [get(a, 0) for a in range(b, b + n)]
+
     def write(self, address: int, value: Optional[int] = 0):
         """Write a value to `address`. If out of bounds, address is clamped."""
         a = int(address)
@@ -1,7 +1,7 @@
 """CacheSimulator coordinates cache accesses and statistics.
 Feeds addresses into the core Cache and updates simple stats. 
 """
-from typing import List, Tuple, Optional, Callable
+from typing import List, Tuple, Optional, Callable, Iterable
 from .cache import Cache, CacheBlock
 from .ram import RAM
 from ..data.stats_export import Statistics
@@ -14,11 +14,33 @@ class CacheSimulator:
         self.ram = ram
         self.sequence: List[Tuple[int, bool]] = []
         self.index = 0
+        # lazily-consumed sequence (see load_sequence_iter): the iterable it
+        # came from, its iterator, the next pending item (lookahead for
+        # has_next) and the announced length
+        self._seq_source = None
+        self._seq_iter = None
+        self._pending = None
+        self.sequence_length = 0
 
     def reset(self):
-        # clear stats and rewind the sequence pointer
+        """Clear stats and cache contents and rewind the loaded sequence.
+
+        A sequence from load_sequence_iter restarts from its first item when
+        its source can be iterated again (a list, a range or any iterable
+        whose iter() returns a fresh iterator). A one-shot iterator cannot
+        be rewound: it is dropped and sequence_length goes back to 0.
+        """
         self.stats.reset()
         self.index = 0
+        source = self._seq_source
+        if source is not None:
+            it = iter(source)
+            if it is source:
+                self._seq_source = self._seq_iter = self._pending = None
+                self.sequence_length = 0
+            else:
+                self._seq_iter = it
+                self._pending = next(it, None)
         # also clear cache contents
         self.cache.reset()
 
@@ -34,19 +56,46 @@ class CacheSimulator:
             values = [None] * len(addresses)
         # store triplets (address, is_write, value)
         self.sequence = list(zip(addresses, writes, values))
+        self.sequence_length = len(self.sequence)
         self.index = 0
+        self._seq_source = self._seq_iter = self._pending = None
         # sequence is a list of (addr, is_write). We step
         # through it with `step()` which advances self.index.
 
+    def load_sequence_iter(self, accesses: Iterable[tuple], length: Optional[int] = None):
+        """Load a lazily-produced sequence of accesses.
+
+        `accesses` yields `(address, is_write)` or `(address, is_write, value)`
+        tuples and is consumed one item per `step()`, so long multi-pass
+        sequences never have to be materialized. `length` is the expected
+        number of items (informational, e.g. for progress display). Pass a
+        re-iterable object rather than a generator if reset() should be able
+        to rewind the sequence.
+        """
+        self.sequence = []
+        self.index = 0
+        self._seq_source = accesses
+        self._seq_iter = iter(accesses)
+        self._pending = next(self._seq_iter, None)
+        self.sequence_length = length if length is not None else 0
+
     def has_next(self) -> bool:
+        if self._seq_iter is not None:
+            return self._pending is not None
         return self.index < len(self.sequence)
 
     def step(self) -> Optional[dict]:
         if not self.has_next():
             return None
 
-        address, is_write, value = self.sequence[self.index]
+        if self._seq_iter is not None:
+            item = self._pending
+            self._pending = next(self._seq_iter, None)
+        else:
+            item = self.sequence[self.index]
         self.index += 1
+        address, is_write = item[0], item[1]
+        value = item[2] if len(item) > 2 else None
 
         # pass through write-miss policy from cache object
         write_miss_policy = getattr(self.cache, 'write_miss_policy', 'write-allocate')
@@ -64,15 +113,19 @@ class CacheSimulator:
                     line_size = getattr(self.cache, 'line_size', 1) or 1
                     base = (int(address) // int(line_size)) * int(line_size)
                     try:
-                        # read each byte of the line and, if the cache just allocated
-                        # the block (set_index/way_index present), populate its data
-                        line_vals = []
-                        for off in range(int(line_size)):
-                            try:
-                                v = self.ram.read(base + off)
-                            except Exception:
-                                v = 0
-                            line_vals.append(v)
+                        # read the line and, if the cache just allocated the
+                        # block (set_index/way_index present), populate its data
+                        try:
+                            line_vals = self.ram.read_block(base, int(line_size))
+                        except Exception:
+                            # line crosses the end of RAM: read byte by byte, 0 past the end
+                            line_vals = []
+                            for off in range(int(line_size)):
+                                try:
+                                    v = self.ram.read(base + off)
+                                except Exception:
+                                    v = 0
+                                line_vals.append(v)
                         # if cache block exists, store loaded bytes into it
                         try:
                             if set_index is not None and way_index is not None and getattr(self.cache, 'sets', None) is not None:
@@ -97,7 +150,7 @@ class CacheSimulator:
                                             # write-through, mem_write will trigger RAM write
                                             try:
                                                 if getattr(self.cache, 'write_policy', '') == 'write-back':
-                                                    blk.dirty = True
+                                                    self.cache.set_dirty(blk, True)
                                             except Exception:
                                                 pass
                                         except Exception:
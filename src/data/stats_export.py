@@ -6,11 +6,11 @@ from dataclasses import dataclass
 import json
 import os
 import tempfile
-from typing import List, Dict, Optional
+from typing import Iterable, Dict, Optional
 from tkinter import filedialog
 
 
-def export_chart_json(hit_rate_history: List[float], stats: Dict[str, float], fpath: Optional[str] = None) -> Optional[str]:
+def export_chart_json(hit_rate_history: Iterable[float], stats: Dict[str, float], fpath: Optional[str] = None) -> Optional[str]:
     """Export hit-rate history and stats to a JSON file. Returns saved path or None.
     """
     try:
@@ -29,7 +29,7 @@ def export_chart_json(hit_rate_history: List[float], stats: Dict[str, float], fp
         return None
 
 
-def export_chart_pdf_from_canvas(canvas, hit_rate_history: List[float], fpath: Optional[str] = None) -> Optional[str]:
+def export_chart_pdf_from_canvas(canvas, hit_rate_history: Iterable[float], fpath: Optional[str] = None) -> Optional[str]:
     """Render the hit-rate history to a PDF using matplotlib and save it.
     Uses `hit_rate_history` to draw the chart. 
     Returns the saved file path or None on cancel/failure.
@@ -4,6 +4,11 @@ This module contains utility routines shared by the UI class. It was
 added to keep the main file more focused and to host the scrolling helper.
 """
 
+from typing import NamedTuple
+
+# base for each radix prefix accepted by int(t, 0)
+_PREFIX_BASE = {'0x': 16, '0X': 16, '0o': 8, '0O': 8, '0b': 2, '0B': 2}
+
 
 def clamp01(x: float) -> float:
     try:
@@ -14,3 +19,89 @@ def clamp01(x: float) -> float:
         return float(x)
     except Exception:
         return 0.0
+
+
+# display strings for byte values, same format as f"{v:#02x}"
+_HEX_TAB = tuple(f"{v:#02x}" for v in range(256))
+
+
+def hex_byte(val: int) -> str:
+    """Format a stored value for the cache/RAM byte labels.
+
+    Values 0..255 come from a precomputed table; anything else falls back
+    to the formatter.
+    """
+    if 0 <= val < 256:
+        return _HEX_TAB[val]
+    return f"{val:#02x}"
+
+
+def hex_bytes(values) -> list:
+    """Format a sequence of stored values like `hex_byte`, in one call."""
+    tab = _HEX_TAB
+    return [tab[v] if 0 <= v < 256 else f"{v:#02x}" for v in values]
+
+
+class FrameLabelEntry:
+    """Widgets of one cache line row in the cache view.
+
+    - frame: the row container
+    - index_label: line number, colored by valid/hit/miss state
+    - byte_labels: one label per byte of the line
+    - dirty_label: shows 'D' for dirty write-back lines
+    """
+
+    __slots__ = ('frame', 'index_label', 'byte_labels', 'dirty_label')
+
+    def __init__(self, frame, index_label, byte_labels, dirty_label):
+        self.frame = frame
+        self.index_label = index_label
+        self.byte_labels = byte_labels
+        self.dirty_label = dirty_label
+
+
+class RunAccesses:
+    """The (address, is_write) accesses of a run: `passes` rounds over `addresses`.
+
+    Accesses are produced lazily, and every iter() starts again from the
+    first one, so CacheSimulator.reset() can rewind a run without the passes
+    being materialized. Missing write flags count as reads.
+    """
+
+    __slots__ = ('addresses', 'writes', 'passes')
+
+    def __init__(self, addresses, writes, passes: int):
+        self.addresses = addresses
+        self.writes = writes
+        self.passes = passes
+
+    def __iter__(self):
+        addresses, writes = self.addresses, self.writes
+        n_writes = len(writes)
+        for _ in range(self.passes):
+            for i, addr in enumerate(addresses):
+                yield addr, writes[i] if i < n_writes else False
+
+    def __len__(self) -> int:
+        return len(self.addresses) * self.passes
+
+
+class RamAccess(NamedTuple):
+    """A temporary RAM row highlight: line base, row color and expiry time."""
+
+    base: int
+    color: str
+    expiry: float
+
+
+def parse_int_token(token: str):
+    """Return the integer spelled by `token` (decimal, 0x/0o/0b) or None.
+
+    The base is picked from the prefix, so each token costs one int() call;
+    unlike int(t, 0), decimals with leading zeros ('010') are accepted.
+    """
+    body = token[1:] if token[:1] in ('+', '-') else token
+    try:
+        return int(token, _PREFIX_BASE.get(body[:2], 10))
+    except ValueError:
+        return None
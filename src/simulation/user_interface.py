@@ -8,12 +8,15 @@ from src.simulation import Simulation
 from src.wrappers.k_associative_cache import K_associative_cache
 from src.data.stats_export import export_chart_json as se_export_chart_json, export_chart_pdf_from_canvas as se_export_chart_pdf_from_canvas
 from src.core.ram import RAM
+from src.simulation._ui_helpers import FrameLabelEntry, RamAccess, RunAccesses, hex_byte, hex_bytes, parse_int_token
 import math
 import json
 import io
 import os
 import tempfile
 import time
+from collections import deque
+from typing import Optional
 from tkinter import filedialog
 
 # wires the widgets to the cache wrappers.
@@ -21,10 +24,42 @@ from tkinter import filedialog
 # Reasonable UI limits so users don't enter absurd numbers
 MAX_CACHE_SIZE = 64
 MAX_LINE_SIZE = 1024
+# most cache blocks the cache view can display
+MAX_CACHE_BLOCKS = 20
 MAX_ADDRESS_WIDTH = 32
 MAX_INPUT_TOKENS = 64
 MIN_ANIM_SPEED = 1
 MAX_ANIM_SPEED = 5000
+MAX_STEPS_PER_TICK = 256
+# animation delays at or below this run the next step via after_idle
+IDLE_STEP_DELAY_MS = 4
+# longest time one animation tick may spend stepping the simulator
+STEP_TIME_BUDGET_S = 0.012
+# number of hit-rate samples kept for the chart
+HIT_RATE_HISTORY_LEN = 200
+# log lines are buffered and written to the log widget at most this often
+LOG_FLUSH_MS = 100
+MAX_LOG_BUFFER = 2000
+# with per-access logging off, one summary line is logged per this many accesses
+LOG_SUMMARY_STEPS = 100
+# quiet period after the last cache/RAM parameter edit before revalidating
+PARAMS_DEBOUNCE_MS = 200
+# quiet period after the last Input edit before the decode preview is redrawn
+DECODE_DEBOUNCE_MS = 120
+# quiet period after the last window resize event before it is applied
+RESIZE_DEBOUNCE_MS = 100
+# most RAM access highlights kept at once
+MAX_RECENT_RAM = 256
+# RAM row colors for accesses noted without an explicit color
+RAM_WRITE_COLOR = '#F44336'
+RAM_READ_COLOR = '#2E7D32'
+# delay before the Input / Write values entries show consumed tokens removed
+ENTRY_FLUSH_MS = 50
+# period of the shared timer that ends RAM highlights
+TRANSIENT_SWEEP_MS = 50
+
+# stand-in for a step info without 'stats'; shared, never mutated
+_EMPTY_STATS = {}
 
 # Hardcoded scenario sequences (users cannot edit these sequences).
 # Each scenario maps to a list of (address, is_write) tuples. These are
@@ -32,11 +67,28 @@ MAX_ANIM_SPEED = 5000
 # scenarios. Manual input is handled by Read/Write buttons below.
 PREDEFINED_SCENARIOS = {
     # increase matrix traversal to a 10x10 matrix (~100 addresses) per user request
-    'Matrix Traversal': [(i * 10 + j, False) for i in range(10) for j in range(10)],
-    'Random Access': [(i * 7 + 3, False) for i in range(16)],
+    'Matrix Traversal': tuple((i * 10 + j, False) for i in range(10) for j in range(10)),
+    'Random Access': tuple((i * 7 + 3, False) for i in range(16)),
 }
 
+# scenario name -> text shown in the scenario box (see _on_scenario_change)
+_SCENARIO_TEXT_CACHE = {}
+
 class UserInterface:
+    # action and playback buttons toggled by _set_controls_enabled
+    _CONTROL_ATTRS = ('read_next_btn', 'write_next_btn', 'run_button', 'apply_assoc_btn',
+                      'play_btn', 'pause_btn', 'step_btn')
+    # _check_params failure code -> (dialog title, widget to focus)
+    _PARAM_ERRORS = {
+        'line_size': ('Invalid parameter', 'line_size_spinbox'),
+        'cache_size': ('Invalid parameter', 'cache_size_spinbox'),
+        'cs_multiple': ('Cache size / Line size mismatch', 'cache_size_spinbox'),
+        'too_many_blocks': ('Too many blocks', 'assoc_spinbox'),
+        'assoc': ('Invalid parameter', 'assoc_spinbox'),
+        'assoc_gt_blocks': ('Associativity too large', 'assoc_spinbox'),
+        'assoc_divisor': ('Associativity mismatch', 'assoc_spinbox'),
+    }
+
     def __init__(self):
         self.window = tk.Tk()
         self.window.title("Cache Simulator Simulator")
@@ -77,36 +129,130 @@ class UserInterface:
         # Fixed animation speed: 1000 ms (1 second) — user control removed
         self.anim_speed = tk.IntVar(value=1000)  # milliseconds per step (fixed)
         self.anim_cap = tk.IntVar(value=256)
+        # number of simulator steps consumed per animation tick; the UI is
+        # refreshed once per batch
+        self.steps_per_tick = tk.IntVar(value=1)
+        # log one line per animated access; when off only periodic summaries are logged
+        self.log_verbose = tk.BooleanVar(value=True)
+        # hit/miss counters for the summary line (see _log_run_summary)
+        self._run_hits = 0
+        self._run_misses = 0
+        self._run_last_addr = None
         # RAM configuration (default to 64 bytes / lines window)
         self.ram_size = tk.IntVar(value=64)
         self.ram_obj = None
+        # (size, line_size) the current ram_obj was built for
+        self._last_ram_sig = None
+        # ram_obj's line size, and ~(line_size - 1) when it is a power of two
+        # so a line base is addr & mask; None otherwise (fall back to modulo)
+        self._ram_line_size = 1
+        self._line_mask = None
+        # manual-mode token state: parsed (address/value, raw span) pairs and
+        # the raw tokens of the Input / Write values entries, consumed from
+        # the left; span is how many raw tokens the parsed one used up
+        self._manual_tokens = deque()
+        self._manual_raw_tokens = deque()
+        self._value_tokens = deque()
+        self._value_raw_tokens = deque()
+        # set when an entry was edited by the user; its tokens are re-parsed
+        # on the next manual access instead of after every access
+        self._manual_dirty = True
+        self._values_dirty = True
+        # set once _ensure_input_bindings has installed the entry traces; the
+        # entries are built once, so the flag is never cleared
+        self._input_bindings_done = False
+        # pending entry rewrite after consuming tokens (see _flush_entry_text)
+        self._entry_flush_id = None
+        self._syncing_entries = False
+        # entries whose text no longer matches their remaining raw tokens
+        self._input_text_stale = False
+        self._values_text_stale = False
+        # parameters/objects the cache view was last redrawn for by _on_params_changed_impl
+        self._last_display_sig = None
         # state used by mapping mode
         self.dir = 0
         self.binary_value = 0
         self.text_boxes = []
         self.cache_wrapper = None
+        # same wrapper, under the name most of the UI code uses
+        self.cache = None
+        # simulator of cache_wrapper (see _set_cache_wrapper)
+        self._sim = None
         self.frame_labels = []
+        # last options applied to each cache label (see _flush_frame_label_updates)
+        self._frame_label_state = {}
+        # rendered RAM byte strings per line base (see _ram_line_texts)
+        self._line_bytes_cache = {}
+        self._line_bytes_ram = None
         # animation/playback state
         self._is_running = False
         self._is_paused = False
         self._do_step = False
         self._anim_results = []
-        self.hit_rate_history = []
+        self.hit_rate_history = deque(maxlen=HIT_RATE_HISTORY_LEN)
+        # hit-rate chart layers: the persistent grid/polyline items and the
+        # last-sample marker id
+        self._hit_chart_items = None
+        self._hit_marker_id = None
         self._after_id = None
-        # recent RAM accesses for temporary highlighting: list of (base_addr, is_write, expiry_ts)
-        self._recent_ram_accesses = []
+        # time.monotonic() the next animation tick is due at; ticks are paced
+        # from this deadline rather than from the end of the previous tick
+        self._next_step_deadline = None
+        # recent RAM accesses for temporary highlighting: RamAccess entries in
+        # expiry order, so expired entries sit at the left
+        self._recent_ram_accesses = deque(maxlen=MAX_RECENT_RAM)
         # last computed mapping from cache frames to RAM base addresses
         self._last_mapped_ram_bases = set()
+        # row bitmap derived from _last_mapped_ram_bases for the RAM view
+        self._mapped_rows = bytearray()
+        self._mapped_rows_src = None
+        self._mapped_rows_layout = None
+        # RAM view change tracking: bumped by _touch_ram_view, compared by
+        # update_ram_display to skip repaints when nothing visible changed
+        self._ram_view_version = 0
+        self._ram_view_drawn = None
+        self._ram_view_expiry = None
+        # addresses whose rows need repainting; None means repaint every row
+        self._ram_dirty_rows = None
         # mapping label_index -> ram base address for animation
         self._last_label_to_ram_base = {}
-        # ram canvas cell bounding boxes: base_addr -> (x1,y1,x2,y2)
-        self._ram_cell_bboxes = {}
-        # last appended log line (used to prevent immediate duplicate debug lines)
-        self._last_log_line = None
-        # last debug message (separate from general last log) to avoid Text-wrapping artifacts
+        # (core, tag_version) the mapping above was last computed for
+        self._mapping_sig = None
+        # log lines waiting for _flush_log and its pending after() id
+        self._log_buf = []
+        self._log_flush_id = None
+        # last DECODE DEBUG line logged, so an identical one is not repeated
         self._last_debug_msg = None
-        # resize debounce state
+        # cached decode geometry (see _get_decode_geom); None means stale
+        self._decode_geom = None
+        # cached per-core cache geometry (see _get_cache_geom)
+        self._geom = None
+        # persistent decode canvas items reused across animation steps
+        self._decode_items = None
+        # one idle-time layout flush per event-loop turn (see _flush_ui)
+        self._ui_flush_id = None
+        self._pending_cache_scroll = None
+        self._pending_ram_scroll = None
+        # coalesced RAM view redraw requested by cache refreshes
+        self._ram_redraw_id = None
+        # coalesced view redraw after manual accesses (latest step info)
+        self._manual_redraw_id = None
+        self._manual_redraw_info = None
+        # step info whose view redraw was skipped while the window was not
+        # viewable (minimized); redrawn when the window is mapped again
+        self._hidden_redraw_info = None
+        # debounced decode preview refresh after Input edits
+        self._decode_panel_id = None
+        # pending after() id of the _sweep_transients timer
+        self._sweep_id = None
+        # resize debounce state: pending after() id and the latest size seen
         self._resize_after_id = None
+        self._pending_window_size = None
+        # last validate_ui_params (key, result); key is (cache_size, line_size, assoc)
+        self._validate_cache = (None, None)
+        # parameter edit debounce: pending after() ids of the handlers
+        self._params_after_id = None
+        self._ram_after_id = None
         self._last_window_size = (0, 0)
 
         # build UI
@@ -203,6 +349,22 @@ class UserInterface:
             pass
         return None
 
+    def get_simulator(self):
+        """Return the simulator of the current cache wrapper, or None."""
+        return self._sim
+
+    def _set_cache_wrapper(self, wrapper):
+        """Make `wrapper` the active cache and remember its simulator.
+
+        Both cache-building paths go through here, so `_sim` (returned by
+        get_simulator) always belongs to the current wrapper.
+        """
+        self._invalidate_geom()
+        self.cache_wrapper = wrapper
+        # also set self.cache for compatibility with other code
+        self.cache = wrapper
+        self._sim = getattr(wrapper, 'sim', None)
+
     def update_rep_set_choices(self):
         """Replacement-set UI removed — keep method as no-op for compatibility."""
         return
@@ -300,16 +462,12 @@ class UserInterface:
         except Exception:
             # fallback: attempt minimal bindings inline
             try:
-                self.input.trace_add('write', lambda *a: self.update_decode_panel())
+                self.input.trace_add('write', lambda *a: self._schedule_decode_panel())
             except Exception:
                 try:
-                    self.input.trace('w', lambda *a: self.update_decode_panel())
+                    self.input.trace('w', lambda *a: self._schedule_decode_panel())
                 except Exception:
                     pass
-            try:
-                inp_entry.bind('<KeyRelease>', lambda e: self.update_decode_panel())
-            except Exception:
-                pass
         row_counter += 1
 
         # Manual read/write buttons (consume input tokens one at a time)
@@ -320,6 +478,8 @@ class UserInterface:
             self.read_next_btn.grid(row=0, column=0, padx=(0, 6))
             self.write_next_btn = ttk.Button(btn_frame, text='Write Next', command=self.write_next)
             self.write_next_btn.grid(row=0, column=1, padx=(0, 6))
+            # Shift+Enter reads a batch of tokens with one view refresh
+            self.window.bind('<Shift-Return>', lambda e: self.read_next_batch())
         except Exception:
             pass
         row_counter += 1
@@ -338,6 +498,15 @@ class UserInterface:
         row_counter += 1
 
         # Animation speed control removed; using fixed 1000 ms per step
+        # Batch size: how many accesses are simulated per animation tick
+        ttk.Label(self.configuration_container, text="Steps per tick:", font=(self.font_container, 11), foreground=self.font_color_1, background=self.background_container).grid(row=row_counter, column=0, sticky=tk.W, pady=3)
+        tk.Spinbox(self.configuration_container, from_=1, to=MAX_STEPS_PER_TICK, textvariable=self.steps_per_tick, width=6).grid(row=row_counter, column=1, sticky=tk.W)
+        row_counter += 1
+        # per-access log toggle (summaries only when off, useful for fast runs)
+        try:
+            ttk.Checkbutton(self.configuration_container, text='Log every access', variable=self.log_verbose).grid(row=row_counter, column=0, columnspan=2, sticky=tk.W, pady=3)
+        except Exception:
+            pass
         row_counter += 1
 
         # decode debug verbosity toggle removed from UI
@@ -552,9 +721,12 @@ class UserInterface:
                     self.ram_list_inner.bind('<Button-5>', lambda e: self.ram_canvas.yview_scroll(1, 'units'))
                 except Exception:
                     pass
-            # container for entries
+            # container for entries; rows hidden when the view shrinks are kept
+            # in _ram_spare_rows and reused before any new row is constructed
             self.ram_line_entries = []
             self._ram_base_to_index = {}
+            self._ram_spare_rows = []
+            self._ram_rows_line = None
         except Exception:
             self.ram_frame = None
             self.ram_canvas = None
@@ -611,6 +783,7 @@ class UserInterface:
             pass
         try:
             self.window.bind('<Configure>', self._on_window_configure)
+            self.window.bind('<Map>', self._on_window_map)
         except Exception:
             pass
         try:
@@ -667,33 +840,38 @@ class UserInterface:
     def _on_scenario_change(self, selection):
         """Handle scenario selection change and populate the scenario_code box."""
         try:
+            # the scenarios are fixed, so each text is built once and inserted
+            # with a single call
+            text = _SCENARIO_TEXT_CACHE.get(selection)
+            if text is None:
+                text = self._scenario_text(selection)
+                _SCENARIO_TEXT_CACHE[selection] = text
             self.scenario_code.configure(state='normal')
             self.scenario_code.delete('1.0', 'end')
-            # Use only predefined scenario descriptions (non-editable sequences)
-            if selection in PREDEFINED_SCENARIOS:
-                # Short human-friendly description
-                if selection == 'Matrix Traversal':
-                    self.scenario_code.insert('end', 'Matrix Traversal (predefined): sequential accesses over a 10x10 matrix\n\n')
-                elif selection == 'Random Access':
-                    self.scenario_code.insert('end', 'Random Access (predefined): fixed pseudo-random pattern\n\n')
-                # (previously had a third predefined scenario; removed)
-                else:
-                    self.scenario_code.insert('end', f'Selected: {selection} (predefined)\n\n')
-                # Show the actual hardcoded sequence (one per line)
-                try:
-                    seq = PREDEFINED_SCENARIOS.get(selection, [])
-                    for (a, w) in seq:
-                        prefix = 'W' if w else 'R'
-                        self.scenario_code.insert('end', f"{prefix}: {hex(a)} ({a})\n")
-                except Exception:
-                    pass
-            else:
-                # custom / free input mode
-                self.scenario_code.insert('end', 'Custom input mode: enter addresses into the Input field and use Read Next / Write Next buttons to consume them.')
+            self.scenario_code.insert('end', text)
             self.scenario_code.configure(state='disabled')
         except Exception:
             pass
 
+    @staticmethod
+    def _scenario_text(selection) -> str:
+        """Return the scenario box text for `selection`."""
+        # Use only predefined scenario descriptions (non-editable sequences)
+        seq = PREDEFINED_SCENARIOS.get(selection)
+        if seq is None:
+            # custom / free input mode
+            return 'Custom input mode: enter addresses into the Input field and use Read Next / Write Next buttons to consume them.'
+        # Short human-friendly description
+        if selection == 'Matrix Traversal':
+            header = 'Matrix Traversal (predefined): sequential accesses over a 10x10 matrix\n\n'
+        elif selection == 'Random Access':
+            header = 'Random Access (predefined): fixed pseudo-random pattern\n\n'
+        # (previously had a third predefined scenario; removed)
+        else:
+            header = f'Selected: {selection} (predefined)\n\n'
+        # Show the actual hardcoded sequence (one per line)
+        return header + ''.join(f"{'W' if w else 'R'}: {hex(a)} ({a})\n" for a, w in seq)
+
     def apply_button_palette(self):
         """Apply a small style palette for buttons (safe no-op if ttk not available)."""
         try:
@@ -703,206 +881,100 @@ class UserInterface:
             pass
 
     def _on_window_configure(self, event):
-        """Window resize handler (debounced)."""
+        """Window resize handler (debounced).
+
+        A drag sends a <Configure> per pixel; the latest size is applied by
+        _apply_resize once RESIZE_DEBOUNCE_MS pass without another one.
+        """
+        # <Configure> on the toplevel also fires for every child widget
+        if event.widget is not self.window:
+            return
+        self._pending_window_size = (event.width, event.height)
+        self._resize_after_id = self._debounce(self._resize_after_id, self._apply_resize,
+                                               RESIZE_DEBOUNCE_MS)
+
+    def _apply_resize(self):
+        """Debounced part of _on_window_configure."""
+        self._resize_after_id = None
+        size, self._pending_window_size = self._pending_window_size, None
         # Minimal implementation: no expensive layout work here.
+        if size is not None and size != self._last_window_size:
+            self._last_window_size = size
+
+    def _visible(self) -> bool:
+        """Return True unless the main window is known not to be viewable."""
         try:
-            size = (event.width, event.height)
-            if size != self._last_window_size:
-                self._last_window_size = size
+            return bool(self.window.winfo_viewable())
         except Exception:
-            pass
+            return True
+
+    def _on_window_map(self, event):
+        """Redraw the views skipped while the window was minimized."""
+        # <Map> on the toplevel also fires for every child widget mapped
+        if event.widget is not self.window:
+            return
+        info, self._hidden_redraw_info = self._hidden_redraw_info, None
+        if info is not None:
+            self._schedule_manual_redraw(info)
+
+    def _schedule_decode_panel(self):
+        """Refresh the decode preview DECODE_DEBOUNCE_MS after the last Input edit.
+
+        Typing, pasting and the entry rewrites after manual accesses each
+        write the Input variable; a burst of them costs one
+        update_decode_panel call once the entry has been quiet.
+        """
+        self._decode_panel_id = self._debounce(self._decode_panel_id, self._do_decode_panel,
+                                               DECODE_DEBOUNCE_MS)
+
+    def _do_decode_panel(self):
+        """Idle callback for _schedule_decode_panel."""
+        self._decode_panel_id = None
+        self.update_decode_panel()
 
     def update_decode_panel(self, *_):
-        """Decode the current address in the Input field and show Tag/Index/Offset."""
+        """Decode the current address in the Input field and show Tag/Index/Offset.
+
+        Drawing is shared with the animation path (_update_decode_from_address),
+        which keeps the canvas items and only updates the bits that changed.
+        """
         try:
-            text = (self.input.get() or '').strip()
-            if not text:
+            # first token, split on commas and whitespace like the manual
+            # tokens, parsed with the same rules (decimal or 0x/0o/0b prefix)
+            tokens = (self.input.get() or '').replace(',', ' ').split(None, 1)
+            addr = parse_int_token(tokens[0]) if tokens else None
+            if addr is None:
                 try:
                     self.decode_addr_label.configure(text="Address: -")
                     if getattr(self, 'decode_result_canvas', None):
                         try:
                             self.decode_result_canvas.delete('all')
+                            self._decode_items = None
                         except Exception:
                             pass
                 except Exception:
                     pass
                 return
-            token = text.split(',')[0].strip()
-            # Expect a plain address token (decimal) or hex with 0x prefix
-            addr_token = token
-            # parse integer (auto-detect 0x prefix). fall back to decimal
-            addr = None
-            try:
-                addr = int(addr_token, 0)
-            except Exception:
-                try:
-                    addr = int(addr_token, 16)
-                except Exception:
-                    try:
-                        addr = int(addr_token)
-                    except Exception:
-                        addr = 0
-
-            # fetch line_size and num_sets
-            try:
-                line_size = max(1, int(self.line_size.get()))
-            except Exception:
-                line_size = 1
-            # try to get core cache values
-            num_sets = None
-            index_bits = 0
-            offset_bits = 0
-            try:
-                core = self.get_core_cache()
-                if core is not None:
-                    num_sets = getattr(core, 'num_sets', None)
-                    bs = getattr(core, 'line_size', None)
-                    if bs:
-                        line_size = bs
-            except Exception:
-                core = None
-
-            if num_sets is None:
-                try:
-                    raw_cache_size = max(1, int(self.cache_size.get()))
-                    associativity = max(1, int(self.associativity.get()))
-                    num_blocks = max(1, raw_cache_size // line_size)
-                    num_sets = max(1, num_blocks // associativity)
-                except Exception:
-                    num_sets = 1
-
-            # compute sizes in bits
-            try:
-                offset_bits = (line_size - 1).bit_length() if line_size > 1 else 0
-                index_bits = (num_sets - 1).bit_length() if num_sets > 1 else 0
-            except Exception:
-                offset_bits = 0
-                index_bits = 0
-
-            block_addr = addr // line_size
-            set_index = block_addr % num_sets if num_sets > 0 else 0
-            tag = block_addr // num_sets if num_sets > 0 else block_addr
-            offset = addr % line_size
 
             # Diagnostic logging for debugging freezes on specific addresses
             try:
-                # compute preliminary bits for logging (safe guards)
-                try:
-                    aw_preview = max(1, int(self.address_width.get()))
-                except Exception:
-                    aw_preview = max(1, index_bits + offset_bits + 1)
-                tb_preview = max(0, aw_preview - (index_bits + offset_bits))
-                bin_preview = bin(addr)[2:].zfill(aw_preview)
                 # Only append debug info when enabled and avoid repeating identical lines
-                try:
-                    if getattr(self, 'show_decode_debug', None) and self.show_decode_debug.get():
-                        debug_msg = f"DECODE DEBUG: addr={addr} line_size={line_size} num_sets={num_sets} index_bits={index_bits} offset_bits={offset_bits} aw={aw_preview} tb={tb_preview} bin={bin_preview}"
-                        # compare against the last debug message (separate from last_log_line)
-                        if getattr(self, '_last_debug_msg', None) != debug_msg:
-                            self._append_log(debug_msg)
-                            try:
-                                self._last_debug_msg = debug_msg
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
+                if getattr(self, 'show_decode_debug', None) and self.show_decode_debug.get():
+                    line_size, num_sets, offset_bits, index_bits, aw, tb, _ = self._get_decode_geom()
+                    debug_msg = f"DECODE DEBUG: addr={addr} line_size={line_size} num_sets={num_sets} index_bits={index_bits} offset_bits={offset_bits} aw={aw} tb={tb} bin={format(addr, f'0{aw}b')}"
+                    # compare against the last debug message
+                    if self._last_debug_msg != debug_msg:
+                        self._append_log(debug_msg)
+                        self._last_debug_msg = debug_msg
             except Exception:
                 pass
-            # build binary representations
-            try:
-                aw = max(1, int(self.address_width.get()))
-            except Exception:
-                aw = max(1, index_bits + offset_bits + 1)
-            # ensure the address width is large enough to display all segments
-            min_aw = max(1, index_bits + offset_bits + 1)
-            aw = max(aw, min_aw)
-            # base binary address
-            raw_bin = bin(addr)[2:]
-            bin_addr = raw_bin.zfill(aw)
-            # slice binary into tag/index/offset based on bit widths
-            tb = max(0, aw - (index_bits + offset_bits))
-            # use slices of bin_addr to avoid mismatches when tag/index/offset
-            # were computed numerically and converted separately
-            tag_bin = bin_addr[:tb] if tb > 0 else ''
-            idx_bin = bin_addr[tb:tb + index_bits] if index_bits > 0 else ''
-            off_bin = bin_addr[tb + index_bits:] if offset_bits > 0 else ''
-
-            # update graphical canvas with binary segments and calculation
-            try:
-                self.decode_addr_label.configure(text=f"Address: {hex(addr)} ({addr})")
-                canvas = getattr(self, 'decode_result_canvas', None)
-                if canvas is None:
-                    return
-                canvas.delete('all')
-                # determine drawing size
-                try:
-                    w = int(canvas.winfo_width()) or 420
-                except Exception:
-                    w = 420
-                try:
-                    h = int(canvas.winfo_height()) or 84
-                except Exception:
-                    h = 84
-                bits = bin_addr
-                n = len(bits)
-                # box dimensions
-                margin = 8
-                avail_w = max(100, w - 2 * margin)
-                box_w = max(12, min(28, avail_w // max(1, n)))
-                box_h = 28
-                start_x = margin
-                y_box = 8
-                # bit boxes with segment colors
-                tb = max(0, aw - (index_bits + offset_bits))
-                for i, b in enumerate(bits):
-                    if i < tb:
-                        color = '#6FA8DC'  # tag (blue)
-                    elif i < tb + index_bits:
-                        color = '#93C47D'  # index (green)
-                    else:
-                        color = '#F9CB9C'  # offset (orange)
-                    x = start_x + i * box_w
-                    try:
-                        canvas.create_rectangle(x, y_box, x + box_w - 2, y_box + box_h, fill=color, outline='#222222')
-                        canvas.create_text(x + box_w / 2, y_box + box_h / 2, text=b, fill='black', font=(self.font_container, 10))
-                    except Exception:
-                        pass
 
-                # draw segment labels centered
-                segs = [
-                    ('TAG', 0, tb),
-                    ('INDEX', tb, tb + index_bits),
-                    ('OFFSET', tb + index_bits, n),
-                ]
-                for label, s, e in segs:
-                    if e > s:
-                        x1 = start_x + s * box_w
-                        x2 = start_x + e * box_w - 2
-                        cx = (x1 + x2) / 2
-                        try:
-                            canvas.create_text(cx, y_box + box_h + 12, text=label, fill='#FFFFFF', font=(self.font_container, 9, 'bold'))
-                            canvas.create_line(cx, y_box + box_h + 6, cx, y_box + box_h, fill='#FFFFFF', arrow='last')
-                        except Exception:
-                            pass
-
-                # calculation detail line
-                calc = f"block_addr = {block_addr} (addr // line_size={line_size}); set = {set_index} (block_addr % {num_sets}); tag = {tag} (block_addr // {num_sets})"
-                try:
-                    canvas.create_text(start_x, y_box + box_h + 34, anchor='w', text=calc, fill='#FFA500', font=(self.font_container, 9))
-                except Exception:
-                    pass
-            except Exception:
-                import traceback as _tb
-                try:
-                    self._append_log('Error in decode canvas drawing:')
-                    self._append_log(''.join(_tb.format_exception_only(*_tb.sys.exc_info()[:2])))
-                except Exception:
-                    pass
+            self._update_decode_from_address(addr)
         except Exception:
             import traceback as _tb
             try:
-                self._append_log('Exception in update_decode_panel:')
-                self._append_log(''.join(_tb.format_exception_only(*_tb.sys.exc_info()[:2])))
+                detail = ''.join(_tb.format_exception_only(*_tb.sys.exc_info()[:2])).rstrip()
+                self._append_log(f'Exception in update_decode_panel:\n{detail}')
             except Exception:
                 pass
 
@@ -937,13 +1009,11 @@ class UserInterface:
             # destroy old widgets
             for entry in getattr(self, 'frame_labels', []):
                 try:
-                    # entry may be a dict with 'frame'
-                    frm = entry.get('frame') if isinstance(entry, dict) else entry
-                    if hasattr(frm, 'destroy'):
-                        frm.destroy()
+                    entry.frame.destroy()
                 except Exception:
                     pass
             self.frame_labels = []
+            self._frame_label_state = {}
 
             # create vertical list of frames inside the scrollable inner frame
             parent = getattr(self, 'cache_list_inner', None) or self.cache_display_frame
@@ -969,7 +1039,7 @@ class UserInterface:
                     # dirty marker label to the right
                     dirt_lbl = tk.Label(line_frame, text='', width=2, bg='#111111', fg='#FFD54F')
                     dirt_lbl.pack(side='right', padx=(6, 0))
-                    self.frame_labels.append({'frame': line_frame, 'index_label': idx_lbl, 'byte_labels': byte_labels, 'dirty_label': dirt_lbl})
+                    self.frame_labels.append(FrameLabelEntry(line_frame, idx_lbl, byte_labels, dirt_lbl))
                 except Exception:
                     pass
         except Exception:
@@ -986,6 +1056,7 @@ class UserInterface:
                 except Exception:
                     pass
                 self._after_id = None
+            self._next_step_deadline = None
             # reset stats display
             self.stat_accesses.configure(text='0')
             self.stat_hits.configure(text='0')
@@ -993,12 +1064,15 @@ class UserInterface:
             self.stat_hit_rate.configure(text='0.000')
             # clear hit-rate history and canvas
             try:
-                self.hit_rate_history = []
+                self.hit_rate_history.clear()
                 self.hit_canvas.delete('all')
+                self._hit_chart_items = None
+                self._hit_marker_id = None
             except Exception:
                 pass
-            # clear logs
+            # clear logs (including lines not flushed yet)
             try:
+                self._log_buf.clear()
                 self.log_text.configure(state='normal')
                 self.log_text.delete('1.0', 'end')
                 self.log_text.configure(state='disabled')
@@ -1008,9 +1082,10 @@ class UserInterface:
             try:
                 wrapper = getattr(self, 'cache_wrapper', None) or getattr(self, 'cache', None)
                 if wrapper is not None:
-                    if hasattr(wrapper, 'sim') and getattr(wrapper, 'sim') is not None:
+                    wsim = getattr(wrapper, 'sim', None)
+                    if wsim is not None:
                         try:
-                            wrapper.sim.reset()
+                            wsim.reset()
                         except Exception:
                             pass
                     core_cache = getattr(wrapper, 'cache', None) or (wrapper if hasattr(wrapper, 'sets') else None)
@@ -1029,11 +1104,11 @@ class UserInterface:
                         self.ram_canvas.delete('all')
                     except Exception:
                         pass
-                # When the canvas is cleared, also clear the cached widget list so
-                # update_ram_display() will recreate row widgets and reflect the
+                # When the canvas is cleared, also retire the row widgets so
+                # update_ram_display() lays them out again and reflects the
                 # reinitialized RAM contents visually.
                 try:
-                    self.ram_line_entries = []
+                    self._retire_ram_rows(0)
                 except Exception:
                     pass
                 try:
@@ -1085,6 +1160,7 @@ class UserInterface:
                     if getattr(self, 'ram_obj', None) is not None:
                         try:
                             self.ram_obj.reset()
+                            self._mark_ram_dirty()
                         except Exception:
                             # If reset fails, attempt to recreate the RAM object
                             try:
@@ -1104,15 +1180,38 @@ class UserInterface:
             pass
 
     def _append_log(self, text: str):
+        """Queue a log line; queued lines are written together by _flush_log.
+
+        Inserting into the Text widget on every animation step is expensive,
+        so lines are buffered and flushed at most every LOG_FLUSH_MS.
+        """
+        try:
+            buf = self._log_buf
+            buf.append(text)
+            if len(buf) > MAX_LOG_BUFFER:
+                # drop the oldest lines if the UI could not keep up
+                del buf[:len(buf) - MAX_LOG_BUFFER]
+            if self._log_flush_id is None:
+                try:
+                    self._log_flush_id = self.window.after(LOG_FLUSH_MS, self._flush_log)
+                except Exception:
+                    # no event loop available: write immediately
+                    self._flush_log()
+        except Exception:
+            pass
+
+    def _flush_log(self):
+        """Write all queued log lines to the log widget with a single insert."""
+        self._log_flush_id = None
+        if not self._log_buf:
+            return
+        text = '\n'.join(self._log_buf) + '\n'
+        self._log_buf.clear()
         try:
             self.log_text.configure(state='normal')
-            self.log_text.insert('end', text + '\n')
+            self.log_text.insert('end', text)
             self.log_text.see('end')
             self.log_text.configure(state='disabled')
-            try:
-                self._last_log_line = text
-            except Exception:
-                pass
         except Exception:
             pass
 
@@ -1177,28 +1276,30 @@ class UserInterface:
             except Exception:
                 aw = MAX_ADDRESS_WIDTH
             max_addr = (1 << min(aw, MAX_ADDRESS_WIDTH)) - 1
+            # single pass; report counts instead of one log line per address
             norm_addresses = []
             norm_writes = []
+            skipped = 0
+            clamped = 0
+            n_writes = len(writes)
             for i, a in enumerate(addresses):
                 if a is None:
                     continue
                 if a < 0:
-                    self._append_log(f"Negative address skipped: {a}")
+                    skipped += 1
                     continue
                 if a > max_addr:
-                    self._append_log(f"Address {a} exceeds address width, clamped to {max_addr}")
+                    clamped += 1
                     a = max_addr
                 norm_addresses.append(a)
-                norm_writes.append(writes[i] if i < len(writes) else False)
+                norm_writes.append(writes[i] if i < n_writes else False)
+            if skipped or clamped:
+                self._append_log(f"{skipped} negative addresses skipped, {clamped} clamped to {max_addr} (address width)")
             addresses = norm_addresses
             writes = norm_writes
 
             # Use the wrapper's simulator if available
-            sim = None
-            if hasattr(self.cache, 'sim') and getattr(self.cache, 'sim') is not None:
-                sim = self.cache.sim
-            elif hasattr(self.cache_wrapper, 'sim') and getattr(self.cache_wrapper, 'sim') is not None:
-                sim = self.cache_wrapper.sim
+            sim = self.get_simulator()
 
             if sim is None:
                 self._append_log('No simulator available')
@@ -1206,11 +1307,14 @@ class UserInterface:
 
             # Load sequence and run using a non-blocking animation loop
             passes = max(1, int(self.num_passes.get()))
-            full_addresses = addresses * passes
-            full_writes = writes * passes
-            sim.load_sequence(full_addresses, writes=full_writes)
+            # feed the passes lazily instead of materializing addresses * passes;
+            # RunAccesses can be iterated again, so Reset rewinds the run
+            run = RunAccesses(addresses, writes, passes)
+            sim.load_sequence_iter(run, length=len(run))
             # store running simulator
             self._running_sim = sim
+            self._run_hits = 0
+            self._run_misses = 0
             self._is_running = True
             self._is_paused = False
             # clear any existing after handler
@@ -1220,6 +1324,7 @@ class UserInterface:
                 except Exception:
                     pass
                 self._after_id = None
+            self._next_step_deadline = None
             # start stepping
             self._animation_step()
         except Exception as e:
@@ -1230,6 +1335,7 @@ class UserInterface:
         try:
             if getattr(self, '_is_paused', False) and getattr(self, '_running_sim', None):
                 self._is_paused = False
+                self._next_step_deadline = None
                 self._animation_step()
             else:
                 self.run_simulation()
@@ -1239,6 +1345,8 @@ class UserInterface:
     def pause_animation(self):
         # Not implemented; placeholder
         self._is_paused = True
+        # resuming starts a new schedule
+        self._next_step_deadline = None
 
     def step_animation(self):
         # Single-step: run only the next address
@@ -1247,55 +1355,30 @@ class UserInterface:
                 return
             if not hasattr(self, 'cache') or self.cache is None:
                 self.apply_associativity()
-            sim = None
-            if hasattr(self.cache, 'sim') and getattr(self.cache, 'sim') is not None:
-                sim = self.cache.sim
-            elif hasattr(self.cache_wrapper, 'sim') and getattr(self.cache_wrapper, 'sim') is not None:
-                sim = self.cache_wrapper.sim
+            sim = self.get_simulator()
             if sim is None:
                 self._append_log('No simulator available')
                 return
             if not sim.has_next():
-                # Reload sequence from input
-                self.run_simulation()
+                # do not silently reload and restart the whole run from a Step click
+                self._append_log('Sequence exhausted; press Run to reload')
                 return
             info = sim.step()
             if info:
+                # the UI helpers below guard themselves, so no per-call try here
+                addr = info.get('address')
                 action = 'W' if info.get('is_write') else 'R'
-                self._append_log(f"Step Addr {info.get('address')} ({action}): {'HIT' if info.get('hit') else 'MISS'}")
-                self._update_stats_widgets(info.get('stats', {}))
+                self._append_log(f"Step Addr {addr} ({action}): {'HIT' if info.get('hit') else 'MISS'}")
+                self._update_stats_widgets(info.get('stats') or _EMPTY_STATS)
                 # update cache display to highlight the most recent access
-                try:
-                    self.update_cache_display(info)
-                except Exception:
-                    pass
-            # record RAM access (for highlighting) and refresh RAM display after this step
-            try:
-                if info and info.get('address') is not None:
-                    try:
-                        self._note_ram_access(info.get('address'), info.get('is_write'))
-                    except Exception:
-                        pass
-                try:
-                    self.update_ram_display()
-                except Exception:
-                    pass
-            except Exception:
-                pass
+                self.update_cache_display(info)
+                # record RAM access (for highlighting) and refresh RAM display after this step
+                if addr is not None:
+                    self._note_ram_access(addr, info.get('is_write'))
+                self._schedule_ram_redraw()
                 # update decode panel to reflect this stepped address as well
-                try:
-                    addr = info.get('address')
-                    if addr is not None:
-                        try:
-                            self._update_decode_from_address(addr)
-                        except Exception:
-                            # fallback to generic decode update
-                            try:
-                                self.update_decode_panel()
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
+                if addr is not None:
+                    self._update_decode_from_address(addr)
         except Exception:
             pass
 
@@ -1306,86 +1389,234 @@ class UserInterface:
             pass
 
     def _animation_step(self):
-        """Perform one simulator step and schedule the next one via after()."""
+        """Perform a batch of simulator steps and schedule the next one via after().
+
+        Up to `steps_per_tick` accesses are simulated per callback, bounded by
+        STEP_TIME_BUDGET_S so a large batch never freezes the window. Log lines
+        and hit-rate samples are collected for every access, but the widgets
+        (log, stats, cache/RAM views, decode panel, chart) are refreshed only
+        once, for the last access of the batch.
+        """
         try:
             if not getattr(self, '_is_running', False) or getattr(self, '_is_paused', False):
                 return
             sim = getattr(self, '_running_sim', None)
             if sim is None:
                 return
-            info = sim.step()
-            if info is None:
-                # finished
+            try:
+                batch = max(1, min(MAX_STEPS_PER_TICK, int(self.steps_per_tick.get())))
+            except Exception:
+                batch = 1
+            try:
+                verbose = bool(self.log_verbose.get())
+            except Exception:
+                verbose = True
+            info = None
+            finished = False
+            log_lines = []
+            # running hit/access counters for the hit-rate history, seeded from
+            # the simulator so the rate stays cumulative like its stats
+            sim_stats = getattr(sim, 'stats', None)
+            ui_hits = getattr(sim_stats, 'hits', 0)
+            ui_acc = getattr(sim_stats, 'accesses', 0)
+            # stop the batch early if it would hold the Tk event loop longer
+            # than STEP_TIME_BUDGET_S; the rest runs on the next tick
+            deadline = time.perf_counter() + STEP_TIME_BUDGET_S
+            for n in range(batch):
+                if n and not n % 16 and time.perf_counter() > deadline:
+                    break
+                step_info = sim.step()
+                if step_info is None:
+                    finished = True
+                    break
+                info = step_info
+                if info.get('mem_write'):
+                    # possibly an eviction write-back to another line; only
+                    # the batch's last info reaches update_cache_display
+                    self._mark_ram_dirty()
+                hit = info.get('hit', False)
+                ui_acc += 1
+                if hit:
+                    ui_hits += 1
+                # deque(maxlen=...) evicts the oldest sample itself
+                self.hit_rate_history.append(ui_hits / ui_acc)
+                if verbose:
+                    action = 'W' if info.get('is_write') else 'R'
+                    log_lines.append(f"Addr {info.get('address')} ({action}): {'HIT' if hit else 'MISS'}")
+                else:
+                    if hit:
+                        self._run_hits += 1
+                    else:
+                        self._run_misses += 1
+                    self._run_last_addr = info.get('address')
+                    if self._run_hits + self._run_misses >= LOG_SUMMARY_STEPS:
+                        log_lines.append(self._log_run_summary())
+
+            if info is not None and not self._visible():
+                # minimized: keep the log and RAM highlights, skip the views
+                # (_on_window_map redraws them for the latest access)
+                if log_lines:
+                    self._append_log('\n'.join(log_lines))
+                addr = info.get('address')
+                if addr is not None:
+                    self._note_ram_access(addr, info.get('is_write'))
+                self._hidden_redraw_info = info
+            elif info is not None:
+                # update UI once for the whole batch; each helper guards its own
+                # widget access, so the single try around this method is enough
+                addr = info.get('address')
+                if log_lines:
+                    self._append_log('\n'.join(log_lines))
+                # _update_stats_widgets also redraws the hit-rate chart
+                self._update_stats_widgets(info.get('stats') or _EMPTY_STATS)
+                self.update_cache_display(info)
+                # record RAM access for UI highlighting and refresh RAM view
+                if addr is not None:
+                    self._note_ram_access(addr, info.get('is_write'))
+                    # shared with the redraw a cache refresh may request
+                    self._schedule_ram_redraw()
+                    # update decode panel to reflect last access (do not change input field)
+                    self._update_decode_from_address(addr)
+
+            if finished:
+                if self._run_hits or self._run_misses:
+                    self._append_log(self._log_run_summary())
                 self._is_running = False
                 self._running_sim = None
                 self._after_id = None
+                self._next_step_deadline = None
                 return
-            # update UI for this step
-            hit = info.get('hit', False)
-            addr = info.get('address')
-            action = 'W' if info.get('is_write') else 'R'
-            self._append_log(f"Addr {addr} ({action}): {'HIT' if hit else 'MISS'}")
-            self._update_stats_widgets(info.get('stats', {}))
-            try:
-                self.update_cache_display(info)
-            except Exception:
-                pass
-            # record RAM access for UI highlighting and refresh RAM view
+
+            # schedule next; Tk cannot honor timers much below its ~10-16 ms
+            # tick, so very short delays run the next batch at idle time instead
+            delay = max(1, int(self.anim_speed.get()))
+            if delay <= IDLE_STEP_DELAY_MS:
+                self._next_step_deadline = None
+                self._after_id = self.window.after_idle(self._animation_step)
+            else:
+                # wait until one period after the previous deadline, so the
+                # time spent stepping does not stretch the period; a tick
+                # that ran late starts a new schedule instead of bunching up
+                now = time.monotonic()
+                deadline = self._next_step_deadline
+                deadline = (now if deadline is None else deadline) + delay / 1000
+                if deadline < now:
+                    deadline = now
+                self._next_step_deadline = deadline
+                self._after_id = self.window.after(max(1, int((deadline - now) * 1000)),
+                                                   self._animation_step)
+        except Exception:
+            pass
+
+    def _log_run_summary(self) -> str:
+        """Return the summary line for accesses counted since the last one and reset the counters."""
+        n = self._run_hits + self._run_misses
+        line = f"last {n} accesses: {self._run_hits} hits, {self._run_misses} misses (last addr {self._run_last_addr})"
+        self._run_hits = 0
+        self._run_misses = 0
+        return line
+
+    def _invalidate_geom(self):
+        """Drop the cached decode/cache geometry so it is recomputed on next use."""
+        self._decode_geom = None
+        self._geom = None
+
+    def _get_cache_geom(self, core):
+        """Return line_size, num_sets, ways and num_blocks of `core` as a dict.
+
+        These do not change while a cache is in use, so the dict is computed
+        once per core object and reused by every display step. The Tk line
+        size is only consulted when the core does not report one. The dict
+        also carries 'flat_blocks' (all blocks in label order),
+        'tag_stride'/'set_base' for turning a label's tag into its RAM base
+        address.
+        """
+        geom = self._geom
+        if geom is not None and geom['core'] is core:
+            return geom
+        line_size = getattr(core, 'line_size', None)
+        if not line_size:
             try:
-                if addr is not None:
-                    try:
-                        self._note_ram_access(addr, info.get('is_write'))
-                    except Exception:
-                        pass
-                    try:
-                        self.update_ram_display()
-                    except Exception:
-                        pass
+                line_size = max(1, int(self.line_size.get()))
             except Exception:
-                pass
-            # update decode panel to reflect last access (do not change input field)
+                line_size = 1
+        sets = getattr(core, 'sets', None)
+        ways = len(sets[0]) if sets else 1
+        # every block in row-major (label) order, and the set of each position
+        flat = getattr(core, 'flat_blocks', None)
+        if flat is None:
+            flat = [b for row in sets or () for b in row]
+        geom = {
+            'core': core,
+            'line_size': line_size,
+            'num_sets': getattr(core, 'num_sets', None) or 1,
+            'ways': ways,
+            'num_blocks': getattr(core, 'num_blocks', None),
+            'flat_blocks': flat,
+        }
+        # RAM base of the block at label k holding `tag`:
+        # (tag * num_sets + set) * line_size == tag * tag_stride + set_base[k]
+        geom['tag_stride'] = geom['num_sets'] * line_size
+        geom['set_base'] = tuple((k // ways) * line_size for k in range(len(flat)))
+        self._geom = geom
+        return geom
+
+    def _get_decode_geom(self):
+        """Return the decode geometry for the current cache configuration.
+
+        Returns a tuple (line_size, num_sets, offset_bits, index_bits, aw, tb,
+        colors_per_bit). The values are computed once and cached until
+        `_invalidate_geom()` is called (parameter change or rebuild).
+        """
+        geom = self._decode_geom
+        if geom is not None:
+            return geom
+        # determine block size and num_sets (same logic as update_decode_panel)
+        try:
+            line_size = max(1, int(self.line_size.get()))
+        except Exception:
+            line_size = 1
+        num_sets = None
+        try:
+            core = self.get_core_cache()
+            if core is not None:
+                num_sets = getattr(core, 'num_sets', None)
+                bs = getattr(core, 'line_size', None)
+                if bs:
+                    line_size = bs
+        except Exception:
+            num_sets = None
+        if num_sets is None:
             try:
-                if addr is not None:
-                    try:
-                        self._update_decode_from_address(addr)
-                    except Exception:
-                        # fall back to updating from input if helper fails
-                        try:
-                            self.update_decode_panel()
-                        except Exception:
-                            pass
+                raw_cache_size = max(1, int(self.cache_size.get()))
+                associativity = max(1, int(self.associativity.get()))
+                num_blocks = max(1, raw_cache_size // line_size)
+                num_sets = max(1, num_blocks // associativity)
             except Exception:
-                pass
+                num_sets = 1
 
-            # update hit-rate history & redraw chart
-            try:
-                hr = info.get('stats', {}).get('hit_rate', None)
-                if hr is None:
-                    # compute from stats dict if not present
-                    s = info.get('stats', {})
-                    accesses = s.get('accesses', 0)
-                    hits = s.get('hits', 0)
-                    hr = (hits / accesses) if accesses else 0.0
-                self.hit_rate_history.append(hr)
-                # cap history length
-                max_len = 200
-                if len(self.hit_rate_history) > max_len:
-                    self.hit_rate_history = self.hit_rate_history[-max_len:]
-                self._draw_hit_chart()
-            except Exception:
-                pass
+        offset_bits = (line_size - 1).bit_length() if line_size > 1 else 0
+        index_bits = (num_sets - 1).bit_length() if num_sets > 1 else 0
 
-            # schedule next
-            delay = max(1, int(self.anim_speed.get()))
-            self._after_id = self.window.after(delay, self._animation_step)
+        try:
+            aw = max(1, int(self.address_width.get()))
         except Exception:
-            pass
+            aw = max(1, index_bits + offset_bits + 1)
+        min_aw = max(1, index_bits + offset_bits + 1)
+        aw = max(aw, min_aw)
+        tb = max(0, aw - (index_bits + offset_bits))
+        # tag (blue), index (green), offset (orange)
+        colors_per_bit = ['#6FA8DC'] * tb + ['#93C47D'] * index_bits + ['#F9CB9C'] * (aw - tb - index_bits)
+        geom = (line_size, num_sets, offset_bits, index_bits, aw, tb, colors_per_bit)
+        self._decode_geom = geom
+        return geom
 
     def _update_decode_from_address(self, addr: int):
-        """Update the decode canvas for a specific address (used by animation steps).
+        """Update the decode canvas for a specific address.
 
-        This is similar to update_decode_panel but operates on a provided address
-        and does not alter the user's input field.
+        Used by animation steps and by update_decode_panel; it does not alter
+        the user's input field. The canvas items are built once per layout and
+        later calls only reconfigure the bit texts and the calculation line.
         """
         try:
             if addr is None:
@@ -1395,107 +1626,89 @@ class UserInterface:
                 self.decode_addr_label.configure(text=f"Address: {hex(addr)} ({addr})")
             except Exception:
                 pass
-            # determine block size and num_sets (same logic as update_decode_panel)
-            try:
-                line_size = max(1, int(self.line_size.get()))
-            except Exception:
-                line_size = 1
+            line_size, num_sets, offset_bits, index_bits, aw, tb, colors = self._get_decode_geom()
+
+            block_addr, offset = divmod(addr, line_size)
+            # the active cache decodes exactly as it will look the address up;
+            # without one, split by the configured geometry
             try:
                 core = self.get_core_cache()
-                if core is not None:
-                    num_sets = getattr(core, 'num_sets', None)
-                    bs = getattr(core, 'line_size', None)
-                    if bs:
-                        line_size = bs
-                else:
-                    num_sets = None
             except Exception:
                 core = None
-                num_sets = None
-            if num_sets is None:
-                try:
-                    raw_cache_size = max(1, int(self.cache_size.get()))
-                    associativity = max(1, int(self.associativity.get()))
-                    num_blocks = max(1, raw_cache_size // line_size)
-                    num_sets = max(1, num_blocks // associativity)
-                except Exception:
-                    num_sets = 1
-
-            try:
-                offset_bits = (line_size - 1).bit_length() if line_size > 1 else 0
-                index_bits = (num_sets - 1).bit_length() if num_sets > 1 else 0
-            except Exception:
-                offset_bits = 0
-                index_bits = 0
-
-            block_addr = addr // line_size
-            set_index = block_addr % num_sets if num_sets > 0 else 0
-            tag = block_addr // num_sets if num_sets > 0 else block_addr
-            offset = addr % line_size
+            if core is not None and getattr(core, 'line_size', None) == line_size and getattr(core, 'num_sets', None) == num_sets:
+                set_index, tag = core.decode(addr)
+            else:
+                tag, set_index = divmod(block_addr, num_sets)
 
-            try:
-                aw = max(1, int(self.address_width.get()))
-            except Exception:
-                aw = max(1, index_bits + offset_bits + 1)
-            min_aw = max(1, index_bits + offset_bits + 1)
-            aw = max(aw, min_aw)
-            bin_addr = bin(addr)[2:].zfill(aw)
+            bin_addr = format(addr, f'0{aw}b')
 
             # draw on canvas
             canvas = getattr(self, 'decode_result_canvas', None)
             if canvas is None:
                 return
-            canvas.delete('all')
             try:
                 w = int(canvas.winfo_width()) or 420
             except Exception:
                 w = 420
-            try:
-                h = int(canvas.winfo_height()) or 84
-            except Exception:
-                h = 84
             bits = bin_addr
             n = len(bits)
+            calc = f"block_addr = {block_addr} (addr // line_size={line_size}); set = {set_index} (block_addr % {num_sets}); tag = {tag} (block_addr // {num_sets})"
+            items = self._decode_items
+            key = (w, n, tb, index_bits)
+            if items is not None and items['key'] == key:
+                # same layout: only mutate the bit texts that changed and the calc line
+                prev = items['bits']
+                texts = items['texts']
+                for i, b in enumerate(bits):
+                    if b != prev[i]:
+                        canvas.itemconfigure(texts[i], text=b)
+                items['bits'] = bits
+                if items['calc_text'] != calc:
+                    canvas.itemconfigure(items['calc'], text=calc)
+                    items['calc_text'] = calc
+                return
+            # layout changed (first call, geometry change or resize): rebuild the scene
+            canvas.delete('all')
+            self._decode_items = None
+            if n > len(colors):
+                # address wider than the configured width: extra bits are offset-colored
+                colors = colors + ['#F9CB9C'] * (n - len(colors))
             margin = 8
             avail_w = max(100, w - 2 * margin)
             box_w = max(12, min(28, avail_w // max(1, n)))
             box_h = 28
             start_x = margin
             y_box = 8
-            tb = max(0, aw - (index_bits + offset_bits))
-            for i, b in enumerate(bits):
-                if i < tb:
-                    color = '#6FA8DC'
-                elif i < tb + index_bits:
-                    color = '#93C47D'
-                else:
-                    color = '#F9CB9C'
+            rects = []
+            texts = []
+            for i, (b, color) in enumerate(zip(bits, colors)):
                 x = start_x + i * box_w
-                try:
-                    canvas.create_rectangle(x, y_box, x + box_w - 2, y_box + box_h, fill=color, outline='#222222')
-                    canvas.create_text(x + box_w / 2, y_box + box_h / 2, text=b, fill='black', font=(self.font_container, 10))
-                except Exception:
-                    pass
-            segs = [
+                rects.append(canvas.create_rectangle(x, y_box, x + box_w - 2, y_box + box_h, fill=color, outline='#222222'))
+                texts.append(canvas.create_text(x + box_w / 2, y_box + box_h / 2, text=b, fill='black', font=(self.font_container, 10)))
+            # segment labels and arrows depend only on the layout key, so they
+            # are created here once and left untouched by later steps
+            segments = []
+            for label, s, e in (
                 ('TAG', 0, tb),
                 ('INDEX', tb, tb + index_bits),
                 ('OFFSET', tb + index_bits, n),
-            ]
-            for label, s, e in segs:
+            ):
                 if e > s:
-                    x1 = start_x + s * box_w
-                    x2 = start_x + e * box_w - 2
-                    cx = (x1 + x2) / 2
-                    try:
-                        canvas.create_text(cx, y_box + box_h + 12, text=label, fill='#FFFFFF', font=(self.font_container, 9, 'bold'))
-                        canvas.create_line(cx, y_box + box_h + 6, cx, y_box + box_h, fill='#FFFFFF', arrow='last')
-                    except Exception:
-                        pass
-            calc = f"block_addr = {block_addr} (addr // line_size={line_size}); set = {set_index} (block_addr % {num_sets}); tag = {tag} (block_addr // {num_sets})"
-            try:
-                canvas.create_text(start_x, y_box + box_h + 34, anchor='w', text=calc, fill='#FFA500', font=(self.font_container, 9))
-            except Exception:
-                pass
+                    cx = (start_x + s * box_w + start_x + e * box_w - 2) / 2
+                    segments.append((
+                        canvas.create_text(cx, y_box + box_h + 12, text=label, fill='#FFFFFF', font=(self.font_container, 9, 'bold')),
+                        canvas.create_line(cx, y_box + box_h + 6, cx, y_box + box_h, fill='#FFFFFF', arrow='last'),
+                    ))
+            calc_id = canvas.create_text(start_x, y_box + box_h + 34, anchor='w', text=calc, fill='#FFA500', font=(self.font_container, 9))
+            self._decode_items = {
+                'key': key,
+                'rects': rects,
+                'texts': texts,
+                'segments': segments,
+                'bits': bits,
+                'calc': calc_id,
+                'calc_text': calc,
+            }
         except Exception:
             try:
                 self._append_log('Exception in _update_decode_from_address')
@@ -1505,10 +1718,14 @@ class UserInterface:
     def update_cache_display(self, info: dict):
         """Color the cache frame labels according to the latest access.
 
-        The UI supports either wrapper-specific `cache_contents` (Direct-mapped)
-        or the core cache object (`wrapper.cache.sets`). This method will
-        inspect available structures and color labels accordingly.
+        The labels follow the core cache object (`wrapper.cache.sets`) in
+        row-major (set, way) order.
         """
+        # a memory write may have been an eviction write-back to a line
+        # other than the accessed one, so drop all cached RAM strings
+        if info and info.get('mem_write'):
+            self._mark_ram_dirty()
+
         try:
             # Update the small "last read" display when this access was a read.
             try:
@@ -1531,334 +1748,104 @@ class UserInterface:
                 wrapper = getattr(self, 'cache', None)
             if wrapper is None:
                 return
-            if hasattr(wrapper, 'cache') and wrapper.cache is not None:
-                core = wrapper.cache
-            elif hasattr(wrapper, 'sets'):
+            core = getattr(wrapper, 'cache', None)
+            if core is None and getattr(wrapper, 'sets', None) is not None:
                 core = wrapper
+            # ways per set, used to map (set, way) to a label index
+            geom = self._get_cache_geom(core) if core is not None else None
+            ways = geom['ways'] if geom is not None else 1
 
-            # Clear all labels to neutral (reset index label and byte labels)
-            for entry in getattr(self, 'frame_labels', []):
-                try:
-                    if isinstance(entry, dict):
-                        idx_lbl = entry.get('index_label')
-                        if idx_lbl is not None:
-                            idx_lbl.configure(bg='#111111')
-                        for bl in entry.get('byte_labels', []):
-                            try:
-                                bl.configure(text='--', bg='#222222', fg='#DDDDDD')
-                            except Exception:
-                                pass
-                        dirt_lbl = entry.get('dirty_label')
-                        if dirt_lbl is not None:
-                            try:
-                                dirt_lbl.configure(text='')
-                            except Exception:
-                                pass
-                    else:
-                        try:
-                            entry.configure(bg='#111111')
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+            # Label changes are queued in `pending` and applied once at the end
+            # by _flush_frame_label_updates, which skips widgets that are
+            # already in the requested state. The neutral pass below therefore
+            # costs no Tk calls for lines that end up unchanged this step.
+            pending = {}
 
-            # reset mapping cache (will be filled below if we can compute mapping)
-            mapped_bases = set()
+            def queue(widget, **opts):
+                pending.setdefault(widget, {}).update(opts)
 
-            # Prefer wrapper cache_contents if present (direct mapped wrapper)
-            if hasattr(wrapper, 'cache_contents') and getattr(wrapper, 'cache_contents'):
-                for i, line in enumerate(wrapper.cache_contents):
-                    valid = line[1] == '1'
-                    tag = line[2]
-                    entry = self.frame_labels[i] if i < len(self.frame_labels) else None
+            # Clear all labels to neutral (reset index label and byte labels)
+            for entry in getattr(self, 'frame_labels', []):
+                queue(entry.index_label, bg='#111111')
+                for bl in entry.byte_labels:
+                    queue(bl, text='--', bg='#222222', fg='#DDDDDD')
+                queue(entry.dirty_label, text='')
+
+            # core Cache sets/ways representation
+            sets = getattr(core, 'sets', None)
+            if sets is not None:
+                rows = len(sets)
+                ways = geom['ways'] if rows > 0 else 0
+                line_size = geom['line_size']
+                num_sets = geom['num_sets']
+                # per-refresh lookups bound once outside the (set, way, byte) loops
+                frame_labels = self.frame_labels
+                n_labels = len(frame_labels)
+                write_back = getattr(core, 'write_policy', '') == 'write-back'
+                ram_line_texts = self._ram_line_texts
+                tag_stride = geom['tag_stride']
+                set_base = geom['set_base']
+                # The same pass also computes the mapping from cache blocks to
+                # RAM base addresses. The cache bumps tag_version whenever a
+                # (valid, tag) pair changes, so the mapping is only rebuilt
+                # when the cache changed since the last refresh.
+                sig = (core, getattr(core, 'tag_version', None))
+                remap = sig[1] is None or sig != self._mapping_sig
+                if remap:
+                    mapped_bases = set()
+                    label_to_base = self._last_label_to_ram_base
+                else:
+                    mapped_bases = self._last_mapped_ram_bases
+                # labels follow the blocks in row-major (set, way) order
+                for k, block in enumerate(geom['flat_blocks'][:n_labels]):
+                    valid = getattr(block, 'valid', False)
+                    try:
+                        tag = int(block.tag)
+                    except (AttributeError, TypeError, ValueError):
+                        tag = None
+                    base = tag * tag_stride + set_base[k] if valid and tag is not None else None
+                    if remap and base is not None:
+                        mapped_bases.add(base)
+                        # map label index (row-major) to ram base for animation
+                        label_to_base[k] = base
+                    # base appearance for valid/invalid and update byte labels
+                    entry = frame_labels[k]
                     if entry:
                         try:
-                            idx_lbl = entry.get('index_label')
-                            b_labels = entry.get('byte_labels', [])
-                            dirt_lbl = entry.get('dirty_label')
-                            if valid:
-                                idx_lbl.configure(bg='#444444')
+                            idx_lbl = entry.index_label
+                            b_labels = entry.byte_labels
+                            dirt_lbl = entry.dirty_label
+                            queue(idx_lbl, bg='#444444' if valid else '#222222')
+                            # populate byte labels from RAM if available
+                            if base is not None:
+                                # Prefer per-byte values stored in cache block (so writes
+                                # to dirty blocks are visible). Fall back to RAM when
+                                # block.data is not present.
+                                try:
+                                    data = getattr(block, 'data', None)
+                                    if data is not None:
+                                        n_data = len(data)
+                                        for off, bl in enumerate(b_labels[:line_size]):
+                                            val = data[off] if off < n_data else None
+                                            queue(bl, text=hex_byte(val) if val is not None else '--', bg='#333333', fg='#FFFFFF')
+                                    else:
+                                        texts = ram_line_texts(base, line_size)
+                                        if None in texts:
+                                            raise IndexError(base)
+                                        for bl, text in zip(b_labels, texts):
+                                            queue(bl, text=text, bg='#333333', fg='#FFFFFF')
+                                except Exception:
+                                    for bl in b_labels:
+                                        queue(bl, text='--', bg='#222222', fg='#DDDDDD')
                             else:
-                                idx_lbl.configure(bg='#222222')
-                            # populate bytes from RAM if tag present
-                            try:
-                                if valid and tag is not None:
-                                    try:
-                                        tag_int = int(tag, 0)
-                                    except Exception:
-                                        try:
-                                            tag_int = int(tag)
-                                        except Exception:
-                                            tag_int = None
-                                    if tag_int is not None:
-                                        nb = getattr(wrapper, 'num_blocks', None) or getattr(wrapper, 'cache', None) and getattr(wrapper.cache, 'num_blocks', None)
-                                        try:
-                                            line_size = getattr(wrapper, 'cache', None) and getattr(wrapper.cache, 'line_size', None) or max(1, int(self.line_size.get()))
-                                        except Exception:
-                                            line_size = max(1, int(self.line_size.get()))
-                                        if nb:
-                                            block_addr = tag_int * nb + i
-                                            base = block_addr * line_size
-                                            ram = getattr(self, 'ram_obj', None)
-                                            for off in range(len(b_labels)):
-                                                try:
-                                                    val = ram.read(base + off) if ram is not None else None
-                                                    text = f"{val:#02x}" if val is not None else '--'
-                                                    b_labels[off].configure(text=text, bg='#333333', fg='#FFFFFF')
-                                                except Exception:
-                                                    b_labels[off].configure(text='--', bg='#222222', fg='#DDDDDD')
-                            except Exception:
                                 for bl in b_labels:
-                                    try:
-                                        bl.configure(text='--', bg='#222222', fg='#DDDDDD')
-                                    except Exception:
-                                        pass
+                                    queue(bl, text='--', bg='#222222', fg='#DDDDDD')
+                            # dirty indicator
+                            queue(dirt_lbl, text='D' if write_back and getattr(block, 'dirty', False) else '')
                         except Exception:
                             pass
-                # highlight the specific accessed line if available in info
-                set_idx = info.get('set_index')
-                way_idx = info.get('way_index')
-                try:
-                    idx = int(set_idx) if set_idx is not None else None
-                    if idx is not None and idx < len(self.frame_labels):
-                        entry = self.frame_labels[idx]
-                        is_hit = bool(info.get('hit'))
-                        color = '#8BC34A' if is_hit else '#F44336'
-                        try:
-                            # color the index label to indicate hit/miss
-                            idx_lbl = entry.get('index_label') if isinstance(entry, dict) else entry
-                            idx_lbl.configure(bg=color)
-                            # auto-scroll to this label so it's visible
-                            try:
-                                self._scroll_cache_to_label(idx)
-                            except Exception:
-                                pass
-                        except Exception:
-                            pass
-                        # only color RAM when this access caused an actual memory read/write
-                        try:
-                            if info and (info.get('mem_read') or info.get('mem_write')):
-                                base = getattr(self, '_last_label_to_ram_base', {}).get(idx)
-                                if base is not None:
-                                    try:
-                                                self._note_ram_access_color(base, color)
-                                                try:
-                                                    # also auto-scroll RAM to the base
-                                                    self._scroll_ram_to_base(base)
-                                                except Exception:
-                                                    pass
-                                                self.update_ram_display()
-                                    except Exception:
-                                        pass
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-                # try to compute mapping into RAM if we can
-                try:
-                    # number of sets/blocks and line size
-                    nb = getattr(wrapper, 'num_blocks', None)
-                    if nb is None and hasattr(wrapper, 'cache'):
-                        nb = getattr(wrapper.cache, 'num_blocks', None)
-                    line_size = None
-                    if hasattr(wrapper, 'cache'):
-                        line_size = getattr(wrapper.cache, 'line_size', None)
-                    if line_size is None:
-                        try:
-                            line_size = max(1, int(self.line_size.get()))
-                        except Exception:
-                            line_size = 1
-                    # each entry in cache_contents: index -> tag
-                    for i, line in enumerate(wrapper.cache_contents):
-                        try:
-                            if line[1] == '1':
-                                t = line[2]
-                                try:
-                                    tag_int = int(t, 0)
-                                except Exception:
-                                    try:
-                                        tag_int = int(t)
-                                    except Exception:
-                                        tag_int = None
-                                if tag_int is not None and nb:
-                                    block_addr = tag_int * nb + i
-                                    base = block_addr * line_size
-                                    mapped_bases.add(base)
-                                    # record which cache label maps to this RAM base
-                                    try:
-                                        self._last_label_to_ram_base[i] = base
-                                    except Exception:
-                                        pass
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-                # store mapping and refresh RAM view
-                try:
-                    self._last_mapped_ram_bases = mapped_bases
-                    try:
-                        self.update_ram_display()
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
-                # Animate RAM->cache load for a miss (core cache branch)
-                try:
-                    if info and (not info.get('hit', True)) and info.get('address') is not None:
-                        addr = int(info.get('address'))
-                        try:
-                            line_size = getattr(core, 'line_size', None) or max(1, int(self.line_size.get()))
-                        except Exception:
-                            line_size = max(1, int(self.line_size.get()))
-                        base = (addr // line_size) * line_size
-                        tgt_idx = None
-                        try:
-                            sidx = info.get('set_index')
-                            widx = info.get('way_index')
-                            if sidx is not None and widx is not None:
-                                try:
-                                    sidx = int(sidx); widx = int(widx)
-                                    tgt_idx = sidx * ways + widx
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                        if tgt_idx is None:
-                            try:
-                                for k, b in getattr(self, '_last_label_to_ram_base', {}).items():
-                                    if b == base:
-                                        tgt_idx = k
-                                        break
-                            except Exception:
-                                pass
-                        try:
-                            if tgt_idx is not None:
-                                self._animate_ram_to_cache(base, tgt_idx)
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-                # Animate RAM->cache load for a miss (if address present and miss)
-                try:
-                    if info and (not info.get('hit', True)) and info.get('address') is not None:
-                        addr = int(info.get('address'))
-                        try:
-                            line_size = max(1, int(getattr(wrapper.cache, 'line_size', self.line_size.get())))
-                        except Exception:
-                            line_size = max(1, int(self.line_size.get()))
-                        base = (addr // line_size) * line_size
-                        # find target label index (prefer set_index/way_index if provided)
-                        tgt_idx = None
-                        try:
-                            sidx = info.get('set_index')
-                            widx = info.get('way_index')
-                            if sidx is not None and widx is not None:
-                                try:
-                                    sidx = int(sidx); widx = int(widx)
-                                    tgt_idx = sidx if tgt_idx is None else tgt_idx
-                                    # for direct mapped wrapper, set_index often equals label index
-                                    tgt_idx = int(sidx)
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                        # fallback: try to find any label mapping to this base
-                        if tgt_idx is None:
-                            try:
-                                for k, b in getattr(self, '_last_label_to_ram_base', {}).items():
-                                    if b == base:
-                                        tgt_idx = k
-                                        break
-                            except Exception:
-                                pass
-                        try:
-                            if tgt_idx is not None:
-                                self._animate_ram_to_cache(base, tgt_idx)
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-                return
-
-            # Otherwise, use core Cache sets/ways representation
-            if core is not None and hasattr(core, 'sets'):
-                sets = core.sets
-                rows = len(sets)
-                ways = len(sets[0]) if rows > 0 else 0
-                # map labels to (set,way) in row-major order
-                k = 0
-                for s in range(rows):
-                    for w in range(ways):
-                        if k >= len(self.frame_labels):
-                            break
-                        block = sets[s][w]
-                        lbl = self.frame_labels[k]
-                        # base appearance for valid/invalid and update byte labels
-                        entry = self.frame_labels[k] if k < len(self.frame_labels) else None
-                        if entry:
-                            try:
-                                idx_lbl = entry.get('index_label')
-                                b_labels = entry.get('byte_labels', [])
-                                dirt_lbl = entry.get('dirty_label')
-                                if getattr(block, 'valid', False):
-                                    idx_lbl.configure(bg='#444444')
-                                else:
-                                    idx_lbl.configure(bg='#222222')
-                                # populate byte labels from RAM if available
-                                try:
-                                    line_size = getattr(core, 'line_size', None) or max(1, int(self.line_size.get()))
-                                except Exception:
-                                    line_size = max(1, int(self.line_size.get()))
-                                num_sets = getattr(core, 'num_sets', None) or 1
-                                try:
-                                    tag = int(getattr(block, 'tag'))
-                                except Exception:
-                                    tag = None
-                                if getattr(block, 'valid', False) and tag is not None:
-                                    block_addr = tag * num_sets + s
-                                    base = block_addr * line_size
-                                    # Prefer per-byte values stored in cache block (so writes
-                                    # to dirty blocks are visible). Fall back to RAM when
-                                    # block.data is not present.
-                                    try:
-                                        if getattr(block, 'data', None) is not None:
-                                            for off in range(line_size):
-                                                try:
-                                                    val = block.data[off] if off < len(block.data) else None
-                                                except Exception:
-                                                    val = None
-                                                text = f"{val:#02x}" if val is not None else '--'
-                                                if off < len(b_labels):
-                                                    b_labels[off].configure(text=text, bg='#333333', fg='#FFFFFF')
-                                        else:
-                                            ram = getattr(self, 'ram_obj', None)
-                                            for off in range(line_size):
-                                                val = ram.read(base + off) if ram is not None else None
-                                                text = f"{val:#02x}" if val is not None else '--'
-                                                if off < len(b_labels):
-                                                    b_labels[off].configure(text=text, bg='#333333', fg='#FFFFFF')
-                                    except Exception:
-                                        for off in range(len(b_labels)):
-                                            b_labels[off].configure(text='--', bg='#222222', fg='#DDDDDD')
-                                else:
-                                    for bl in b_labels:
-                                        try:
-                                            bl.configure(text='--', bg='#222222', fg='#DDDDDD')
-                                        except Exception:
-                                            pass
-                                # dirty indicator
-                                try:
-                                    if getattr(block, 'dirty', False) and getattr(core, 'write_policy', '') == 'write-back':
-                                        dirt_lbl.configure(text='D')
-                                    else:
-                                        dirt_lbl.configure(text='')
-                                except Exception:
-                                    pass
-                            except Exception:
-                                pass
-                        k += 1
-
-                # highlight accessed set/way
+
+                # highlight accessed set/way
                 try:
                     sidx = info.get('set_index')
                     widx = info.get('way_index')
@@ -1870,70 +1857,31 @@ class UserInterface:
                             entry = self.frame_labels[label_index]
                             is_hit = bool(info.get('hit'))
                             color = '#8BC34A' if is_hit else '#F44336'
-                            try:
-                                idx_lbl = entry.get('index_label') if isinstance(entry, dict) else entry
-                                idx_lbl.configure(bg=color)
-                                try:
-                                    self._scroll_cache_to_label(label_index)
-                                except Exception:
-                                    pass
-                            except Exception:
-                                pass
+                            queue(entry.index_label, bg=color)
+                            self._scroll_cache_to_label(label_index)
                             # ensure dirty indicator remains visible if present
-                            try:
-                                block = sets[sidx][widx]
-                                dirt_lbl = entry.get('dirty_label') if isinstance(entry, dict) else None
-                                if getattr(block, 'dirty', False) and getattr(core, 'write_policy', '') == 'write-back':
-                                    try:
-                                        if dirt_lbl is not None:
-                                            dirt_lbl.configure(text='D')
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                pass
-                            # sync RAM highlight for mapped base if available
-                            try:
-                                # only color RAM when this access actually touched memory
-                                if info and (info.get('mem_read') or info.get('mem_write')):
-                                    base = getattr(self, '_last_label_to_ram_base', {}).get(label_index)
-                                    if base is not None:
-                                        try:
-                                            self._note_ram_access_color(base, color)
-                                            self.update_ram_display()
-                                        except Exception:
-                                            pass
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
-                # compute mapping from cache blocks to RAM base addresses
-                try:
-                    mapped_bases = set()
-                    line_size = getattr(core, 'line_size', None) or max(1, int(self.line_size.get()))
-                    num_sets = getattr(core, 'num_sets', None) or 1
-                    for s in range(rows):
-                        for w in range(ways):
-                            try:
-                                block = sets[s][w]
-                                if getattr(block, 'valid', False) and getattr(block, 'tag', None) is not None:
-                                    tag = int(block.tag)
-                                    block_addr = tag * num_sets + s
-                                    base = block_addr * line_size
-                                    mapped_bases.add(base)
-                                    # map label index (row-major) to ram base for animation
-                                    try:
-                                        label_index = s * ways + w
-                                        self._last_label_to_ram_base[label_index] = base
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                pass
-                except Exception:
-                    mapped_bases = set()
-                try:
+                            if write_back and getattr(sets[sidx][widx], 'dirty', False):
+                                queue(entry.dirty_label, text='D')
+                            # sync RAM highlight for mapped base if available;
+                            # only color RAM when this access actually touched memory
+                            if info.get('mem_read') or info.get('mem_write'):
+                                base = self._last_label_to_ram_base.get(label_index)
+                                if base is not None:
+                                    self._note_ram_access_color(base, color)
+                                    self._schedule_ram_redraw()
+                except (AttributeError, IndexError, TypeError, ValueError):
+                    # malformed access info or a cache resized under us:
+                    # the neutral colouring above still stands
+                    pass
+                if remap:
+                    self._mapping_sig = sig
+                self._flush_frame_label_updates(pending)
+                try:
+                    if mapped_bases != self._last_mapped_ram_bases:
+                        self._touch_ram_view(*(mapped_bases ^ self._last_mapped_ram_bases))
                     self._last_mapped_ram_bases = mapped_bases
                     try:
-                        self.update_ram_display()
+                        self._schedule_ram_redraw()
                     except Exception:
                         pass
                 except Exception:
@@ -1941,18 +1889,167 @@ class UserInterface:
         except Exception:
             pass
 
+    def _ram_line_texts(self, base: int, count: int) -> list:
+        """Return display strings for `count` RAM bytes starting at `base`.
+
+        Results are cached per base until `_mark_ram_dirty` drops them. A
+        byte that cannot be read is returned as None.
+        """
+        ram = getattr(self, 'ram_obj', None)
+        if ram is not self._line_bytes_ram:
+            # RAM object was recreated: nothing cached is valid anymore
+            self._line_bytes_cache.clear()
+            self._line_bytes_ram = ram
+        texts = self._line_bytes_cache.get(base)
+        if texts is not None and len(texts) == count:
+            return texts
+        if ram is None:
+            texts = ['--'] * count
+        else:
+            try:
+                texts = hex_bytes(ram.read_block(base, count))
+            except Exception:
+                # line crosses the end of RAM: unreadable bytes become None
+                texts = []
+                for off in range(count):
+                    try:
+                        texts.append(hex_byte(ram.read(base + off)))
+                    except Exception:
+                        texts.append(None)
+        self._line_bytes_cache[base] = texts
+        return texts
+
+    def _mark_ram_dirty(self, addr: int = None):
+        """Drop cached RAM byte strings covering `addr` (all of them if None).
+
+        RAM contents changed, so the RAM view is marked for repaint as well.
+        """
+        if addr is None:
+            self._touch_ram_view()
+        else:
+            self._touch_ram_view(addr)
+        cache = self._line_bytes_cache
+        if addr is None:
+            cache.clear()
+            return
+        for b in [b for b, texts in cache.items() if b <= addr < b + len(texts)]:
+            del cache[b]
+
+    def _flush_frame_label_updates(self, pending: dict):
+        """Apply queued cache label options, skipping ones already in effect.
+
+        `pending` maps a label widget to the options it should show after
+        this step. Options that were applied on an earlier step are dropped
+        so Tk only sees real changes.
+        """
+        applied = self._frame_label_state
+        for widget, opts in pending.items():
+            prev = applied.get(widget)
+            if prev is None:
+                changed = opts
+            else:
+                changed = {k: v for k, v in opts.items() if prev.get(k) != v}
+            if not changed:
+                continue
+            try:
+                widget.configure(**changed)
+            except Exception:
+                continue
+            if prev is None:
+                applied[widget] = dict(opts)
+            else:
+                prev.update(changed)
+
+    def _schedule_ram_redraw(self):
+        """Schedule one update_ram_display for this event-loop turn (no-op if already scheduled)."""
+        if self._ram_redraw_id is None:
+            try:
+                self._ram_redraw_id = self.window.after_idle(self._do_ram_redraw)
+            except Exception:
+                self.update_ram_display()
+
+    def _do_ram_redraw(self):
+        """Idle callback for _schedule_ram_redraw."""
+        self._ram_redraw_id = None
+        self.update_ram_display()
+
+    def _schedule_manual_redraw(self, info: dict):
+        """Redraw the views for manual access `info` at idle time (coalesced).
+
+        Only the latest info is kept, so several manual accesses made before
+        the event loop goes idle cost one redraw.
+        """
+        self._manual_redraw_info = info
+        if self._manual_redraw_id is None:
+            try:
+                self._manual_redraw_id = self.window.after_idle(self._do_manual_redraw)
+            except Exception:
+                self._do_manual_redraw()
+
+    def _do_manual_redraw(self):
+        """Idle callback for _schedule_manual_redraw."""
+        self._manual_redraw_id = None
+        info, self._manual_redraw_info = self._manual_redraw_info, None
+        if info is None:
+            return
+        if not self._visible():
+            # nothing to look at; _on_window_map redraws once shown again
+            self._hidden_redraw_info = info
+            return
+        # also redraws the hit-rate chart with the samples appended meanwhile
+        self._update_stats_widgets(info.get('stats') or _EMPTY_STATS)
+        try:
+            self.update_cache_display(info)
+        except Exception:
+            pass
+        self._schedule_ram_redraw()
+
+    def _request_ui_flush(self):
+        """Schedule one _flush_ui for this event-loop turn (no-op if already scheduled)."""
+        if self._ui_flush_id is None:
+            try:
+                self._ui_flush_id = self.window.after_idle(self._flush_ui)
+            except Exception:
+                self._flush_ui()
+
+    def _flush_ui(self):
+        """Run pending geometry updates once, then apply any requested scrolls.
+
+        Cache/RAM refreshes only record what should be scrolled into view;
+        this single idle callback flushes layout with one update_idletasks()
+        and performs the scrolls on the settled geometry.
+        """
+        self._ui_flush_id = None
+        try:
+            self.window.update_idletasks()
+        except Exception:
+            pass
+        index, self._pending_cache_scroll = self._pending_cache_scroll, None
+        if index is not None:
+            self._do_scroll_cache_to_label(index)
+        base, self._pending_ram_scroll = self._pending_ram_scroll, None
+        if base is not None:
+            self._do_scroll_ram_to_base(base)
+
     def _scroll_cache_to_label(self, index: int):
+        """Request that the cache label at `index` be centered on the next UI flush."""
+        self._pending_cache_scroll = index
+        self._request_ui_flush()
+
+    def _scroll_ram_to_base(self, base: int):
+        """Request that the RAM row for `base` be centered on the next UI flush."""
+        self._pending_ram_scroll = base
+        self._request_ui_flush()
+
+    def _do_scroll_cache_to_label(self, index: int):
         """Scroll the cache canvas so the given index is centered (if possible)."""
         try:
             if not getattr(self, 'cache_canvas', None) or not getattr(self, 'cache_list_inner', None):
                 return
             if index is None or index < 0 or index >= len(getattr(self, 'frame_labels', [])):
                 return
-            entry = self.frame_labels[index]
-            widget = entry.get('frame') if isinstance(entry, dict) else entry
-            # ensure sizes are up-to-date
-            self.cache_canvas.update_idletasks()
-            widget.update_idletasks()
+            widget = self.frame_labels[index].frame
+            # sizes are up to date: _flush_ui ran update_idletasks() first
             inner_h = self.cache_list_inner.winfo_height() or 1
             canvas_h = self.cache_canvas.winfo_height() or 1
             y = widget.winfo_y()
@@ -1975,7 +2072,7 @@ class UserInterface:
         except Exception:
             pass
 
-    def _scroll_ram_to_base(self, base: int):
+    def _do_scroll_ram_to_base(self, base: int):
         """Scroll the RAM canvas so the given base address row is visible/centered."""
         try:
             if not getattr(self, 'ram_canvas', None) or not getattr(self, 'ram_list_inner', None):
@@ -1985,8 +2082,6 @@ class UserInterface:
                 return
             entry = self.ram_line_entries[idx]
             widget = entry.get('frame')
-            self.ram_canvas.update_idletasks()
-            widget.update_idletasks()
             inner_h = self.ram_list_inner.winfo_height() or 1
             canvas_h = self.ram_canvas.winfo_height() or 1
             y = widget.winfo_y()
@@ -2032,143 +2127,241 @@ class UserInterface:
             MAX_LINES = 256
             show_lines = min(MAX_LINES, total_lines)
 
-            # purge expired recent-access markers and build a map for fast lookup
-            try:
-                now = time.time()
-                self._recent_ram_accesses = [(b, w, e) for (b, w, e) in getattr(self, '_recent_ram_accesses', []) if e > now]
-            except Exception:
-                pass
-            recent_map = {}
-            try:
-                for (b, w, e) in getattr(self, '_recent_ram_accesses', []):
-                    if b not in recent_map:
-                        recent_map[b] = w
-            except Exception:
-                recent_map = {}
+            # skip the repaint when nothing shown changed since the last one and
+            # no highlight has expired in the meantime
+            now = time.monotonic()
+            view_key = (self._ram_view_version, ram, show_lines)
+            if (view_key == self._ram_view_drawn
+                    and len(getattr(self, 'ram_line_entries', None) or ()) == show_lines
+                    and (self._ram_view_expiry is None or now < self._ram_view_expiry)):
+                return
 
-            # create widgets if not present or size changed
-            try:
-                if not getattr(self, 'ram_line_entries', None) or len(self.ram_line_entries) != show_lines:
-                    # destroy existing
-                    for ent in getattr(self, 'ram_line_entries', []) or []:
-                        try:
-                            frm = ent.get('frame')
-                            if hasattr(frm, 'destroy'):
-                                frm.destroy()
-                        except Exception:
-                            pass
-                    self.ram_line_entries = []
-                    self._ram_base_to_index = {}
-                    for i in range(show_lines):
-                        try:
-                            base = i * line
-                            row_frm = ttk.Frame(self.ram_list_inner, padding=(2, 2))
-                            row_frm.grid(row=i, column=0, sticky='ew', pady=1)
-                            # show the RAM line index (0-based) so numbering matches cache lines
-                            addr_lbl = tk.Label(row_frm, text=f"#{i}", width=8, bg='#111111', fg='#CCCCCC', relief='ridge')
-                            addr_lbl.pack(side='left', padx=(2, 8))
-                            bytes_frame = ttk.Frame(row_frm)
-                            bytes_frame.pack(side='left', fill='x', expand=True)
-                            b_labels = []
-                            for off in range(line):
-                                bl = tk.Label(bytes_frame, text='--', width=6, bg='#222222', fg='#DDDDDD', relief='groove')
-                                bl.pack(side='left', padx=2)
-                                b_labels.append(bl)
-                            marker_lbl = tk.Label(row_frm, text='', width=2, bg='#111111', fg='#FFFFFF')
-                            marker_lbl.pack(side='right', padx=(8, 2))
-                            ent = {'frame': row_frm, 'addr': base, 'addr_label': addr_lbl, 'byte_labels': b_labels, 'marker': marker_lbl}
-                            self.ram_line_entries.append(ent)
-                            self._ram_base_to_index[base] = i
-                        except Exception:
-                            pass
+            dirty = self._ram_dirty_rows
+            drawn = self._ram_view_drawn
+            if drawn is None or drawn[1:] != view_key[1:]:
+                # different RAM object or row count: everything is stale
+                dirty = None
+
+            # purge expired recent-access markers (their rows need repainting)
+            # and build a map for fast lookup
+            recent = self._recent_ram_accesses
+            while recent and recent[0].expiry <= now:
+                b = recent.popleft().base
+                if dirty is not None:
+                    dirty.add(b)
+            self._ram_view_expiry = recent[0].expiry if recent else None
+            recent_map = {}
+            for acc in recent:
+                if acc.base not in recent_map:
+                    recent_map[acc.base] = acc.color
+
+            # grow or shrink the row list when the row count or the bytes per
+            # row changed; widgets are only constructed when the view needs
+            # more rows than were ever built
+            try:
+                entries = self.ram_line_entries
+                if len(entries) != show_lines or self._ram_rows_line != line:
+                    dirty = None
+                    # rows whose base moved need laying out again
+                    start = 0 if self._ram_rows_line != line else min(len(entries), show_lines)
+                    self._retire_ram_rows(show_lines)
+                    spare = self._ram_spare_rows
+                    while len(entries) < show_lines:
+                        entries.append(spare.pop() if spare else self._create_ram_row())
+                    for i in range(start, show_lines):
+                        self._layout_ram_row(entries[i], i, line)
+                    self._ram_rows_line = line
             except Exception:
                 pass
 
+            # per-row "mapped into cache" flags as a bytearray indexed by row;
+            # rebuilt only when the mapped set object or the row layout changes
+            mapped = self._last_mapped_ram_bases
+            if self._mapped_rows_src is not mapped or self._mapped_rows_layout != (line, show_lines):
+                rows_bm = bytearray(show_lines)
+                for b in mapped:
+                    i, rem = divmod(b, line)
+                    if not rem and 0 <= i < show_lines:
+                        rows_bm[i] = 1
+                self._mapped_rows = rows_bm
+                self._mapped_rows_src = mapped
+                self._mapped_rows_layout = (line, show_lines)
+            rows_bm = self._mapped_rows
+
+            # only the rows containing a dirty address are revisited, unless
+            # the whole view is stale
+            entries = self.ram_line_entries
+            if dirty is not None:
+                index = self._ram_base_to_index
+                rows = {index.get((a // line) * line) for a in dirty}
+                rows.discard(None)
+                entries = [entries[i] for i in sorted(rows) if i < len(entries)]
+
             # populate values and highlight recent accesses
             try:
-                for ent in self.ram_line_entries:
+                for ent in entries:
                     try:
                         base = ent.get('addr')
                         bytes_labels = ent.get('byte_labels', [])
                         marker = ent.get('marker')
-                        is_recent = base in recent_map
                         # set background color
-                        bg = '#111111'
-                        txt_color = '#DDDDDD'
-                        if is_recent:
-                            m = recent_map.get(base)
-                            if isinstance(m, str):
-                                bg = m; txt_color = '#FFFFFF'
-                            else:
-                                bg = '#F44336' if bool(m) else '#2E7D32'; txt_color = '#FFFFFF'
-                        try:
+                        bg = recent_map.get(base)
+                        if bg is not None:
+                            txt_color = '#FFFFFF'
+                        else:
+                            bg = '#111111'
+                            txt_color = '#DDDDDD'
+                        # each row remembers what it shows ('addr_state', 'texts',
+                        # 'marker_state') so unchanged labels cost no Tk call
+                        if ent.get('addr_state') != (bg, txt_color):
                             ent.get('addr_label').configure(bg=bg, fg=txt_color)
-                        except Exception:
-                            pass
-                        # populate byte values
-                        for off, bl in enumerate(bytes_labels):
-                            try:
-                                val = ram.read(base + off)
-                                bl.configure(text=f"{val:#02x}", bg='#333333', fg='#FFFFFF')
-                            except Exception:
-                                try:
+                            ent['addr_state'] = (bg, txt_color)
+                        # populate byte values (rendered strings are shared with the cache view;
+                        # the same list object comes back until that RAM line changes)
+                        texts = self._ram_line_texts(base, len(bytes_labels))
+                        prev = ent.get('texts')
+                        if prev is not texts:
+                            prev = prev or ()
+                            for off, (bl, text) in enumerate(zip(bytes_labels, texts)):
+                                if off < len(prev) and prev[off] == text:
+                                    continue
+                                if text is not None:
+                                    bl.configure(text=text, bg='#333333', fg='#FFFFFF')
+                                else:
                                     bl.configure(text='--', bg='#222222', fg='#DDDDDD')
-                                except Exception:
-                                    pass
+                            ent['texts'] = texts
                         # show mapping outline if base is in last mapped bases
-                        try:
-                            if getattr(self, '_last_mapped_ram_bases', None) and base in self._last_mapped_ram_bases:
-                                marker.configure(text='M')
-                            else:
-                                marker.configure(text='')
-                        except Exception:
-                            pass
+                        marker_text = 'M' if rows_bm[base // line] else ''
+                        if ent.get('marker_state') != marker_text:
+                            marker.configure(text=marker_text)
+                            ent['marker_state'] = marker_text
                     except Exception:
                         pass
             except Exception:
                 pass
 
-            # update scrollbar (no-op: canvas.bind handlers keep scrollregion updated)
-            try:
-                self.ram_canvas.update_idletasks()
-            except Exception:
-                pass
+            self._ram_view_drawn = view_key
+            self._ram_dirty_rows = set()
+            # layout is flushed once per event-loop turn by _flush_ui
+            self._request_ui_flush()
         except Exception:
             pass
 
+    def _create_ram_row(self) -> dict:
+        """Construct the widgets of one RAM row (laid out by _layout_ram_row)."""
+        row_frm = ttk.Frame(self.ram_list_inner, padding=(2, 2))
+        # show the RAM line index (0-based) so numbering matches cache lines
+        addr_lbl = tk.Label(row_frm, text='', width=8, bg='#111111', fg='#CCCCCC', relief='ridge')
+        addr_lbl.pack(side='left', padx=(2, 8))
+        bytes_frame = ttk.Frame(row_frm)
+        bytes_frame.pack(side='left', fill='x', expand=True)
+        marker_lbl = tk.Label(row_frm, text='', width=2, bg='#111111', fg='#FFFFFF')
+        marker_lbl.pack(side='right', padx=(8, 2))
+        return {'frame': row_frm, 'addr': None, 'addr_label': addr_lbl, 'bytes_frame': bytes_frame,
+                'byte_labels': [], 'marker': marker_lbl}
+
+    def _layout_ram_row(self, ent: dict, i: int, line: int):
+        """Place row `ent` at grid row `i` showing RAM line `i` of `line` bytes.
+
+        Byte labels are added or destroyed to match `line`, and the row's
+        remembered display state is dropped so the next paint fills it in.
+        """
+        b_labels = ent['byte_labels']
+        while len(b_labels) > line:
+            b_labels.pop().destroy()
+        while len(b_labels) < line:
+            bl = tk.Label(ent['bytes_frame'], text='--', width=6, bg='#222222', fg='#DDDDDD', relief='groove')
+            bl.pack(side='left', padx=2)
+            b_labels.append(bl)
+        base = i * line
+        old = ent.get('addr')
+        if old is not None and self._ram_base_to_index.get(old) == i:
+            del self._ram_base_to_index[old]
+        ent['addr'] = base
+        self._ram_base_to_index[base] = i
+        ent['addr_label'].configure(text=f"#{i}")
+        ent['frame'].grid(row=i, column=0, sticky='ew', pady=1)
+        ent.pop('texts', None)
+        ent.pop('addr_state', None)
+        ent.pop('marker_state', None)
+
+    def _retire_ram_rows(self, keep: int):
+        """Hide RAM rows beyond the first `keep` and move them to the spare list."""
+        entries = self.ram_line_entries
+        index = self._ram_base_to_index
+        while len(entries) > keep:
+            ent = entries.pop()
+            ent['frame'].grid_remove()
+            if index.get(ent.get('addr')) == len(entries):
+                del index[ent['addr']]
+            self._ram_spare_rows.append(ent)
+
+    def _touch_ram_view(self, *addrs):
+        """Mark the RAM view as changed so the next update_ram_display repaints.
+
+        With addresses, only the rows containing them are repainted; without,
+        the whole view is.
+        """
+        self._ram_view_version += 1
+        if not addrs:
+            self._ram_dirty_rows = None
+        elif self._ram_dirty_rows is not None:
+            self._ram_dirty_rows.update(addrs)
+
     def _draw_hit_chart(self):
+        """Draw the hit-rate history on the small chart canvas.
+
+        All items persist between draws: the grid (tag 'bg') is created once
+        per canvas size, the polyline is moved with a single coords() call,
+        and the last-sample marker (tag 'fg') is moved and recolored in place.
+        """
         try:
             canvas = self.hit_canvas
-            canvas.delete('all')
             w = int(canvas['width'])
             h = int(canvas['height'])
             data = list(self.hit_rate_history)
             n = len(data)
             if n == 0:
+                canvas.delete('all')
+                self._hit_chart_items = None
+                self._hit_marker_id = None
                 return
-            # draw background grid
-            for y in range(0, h, 10):
-                canvas.create_line(0, y, w, y, fill='#1f1f1f')
-            # plot line scaled to height
-            max_points = w
-            step = max(1, n / max_points)
-            points = []
-            for i in range(n):
-                x = int((i / max(1, n - 1)) * (w - 4)) if n > 1 else 0
-                y = int((1.0 - data[i]) * (h - 4))
-                points.append((x + 2, y + 2))
-            # draw polyline
-            flat = []
-            for (x, y) in points:
-                flat.extend([x, y])
+            items = self._hit_chart_items
+            if items is None or items['size'] != (w, h):
+                # first draw or resized canvas: build grid and an empty polyline
+                canvas.delete('all')
+                self._hit_marker_id = None
+                for y in range(0, h, 10):
+                    canvas.create_line(0, y, w, y, fill='#1f1f1f', tags='bg')
+                line_id = canvas.create_line(0, 0, 0, 0, fill='#FFA500', width=2, smooth=True,
+                                             state='hidden', tags='bg')
+                items = self._hit_chart_items = {'size': (w, h), 'line': line_id}
+            # polyline: plot line scaled to height; the x positions only
+            # depend on the sample count, so they are kept until it changes
+            xs = items.get('xs')
+            if xs is None or len(xs) != n:
+                sx = (w - 4) / max(1, n - 1)
+                xs = items['xs'] = [int(i * sx) + 2 for i in range(n)] if n > 1 else [2]
+            sy = h - 4
+            flat = [0] * (2 * n)
+            flat[0::2] = xs
+            flat[1::2] = [int((1.0 - v) * sy) + 2 for v in data]
             if len(flat) >= 4:
-                canvas.create_line(*flat, fill='#FFA500', width=2, smooth=True)
-            # draw last point marker colored by last hit rate
+                canvas.coords(items['line'], *flat)
+                canvas.itemconfigure(items['line'], state='normal')
+            else:
+                canvas.itemconfigure(items['line'], state='hidden')
+            # foreground layer: move the last point marker colored by last hit rate
             last = data[-1]
-            cx = points[-1][0]
-            cy = points[-1][1]
+            cx = (w - 4 if n > 1 else 0) + 2
+            cy = int((1.0 - last) * (h - 4)) + 2
             color = '#8BC34A' if last >= 0.75 else ('#F44336' if last < 0.5 else '#FFA500')
-            canvas.create_oval(cx-3, cy-3, cx+3, cy+3, fill=color, outline='')
+            if self._hit_marker_id is None:
+                self._hit_marker_id = canvas.create_oval(cx-3, cy-3, cx+3, cy+3, fill=color, outline='', tags='fg')
+            else:
+                canvas.coords(self._hit_marker_id, cx-3, cy-3, cx+3, cy+3)
+                canvas.itemconfigure(self._hit_marker_id, fill=color)
+            canvas.tag_raise('fg')
         except Exception:
             pass
 
@@ -2199,74 +2392,25 @@ class UserInterface:
             self._append_log(f'Failed to export chart: {e}')
 
     def direct_mapped_algorithm(self):
-        self.associativity.set(1)
-        self.cache_type.set('Direct-Mapped')
-        # Build generic k-associative wrapper with k=1
-        try:
-            self._ensure_ram_object()
-        except Exception:
-            pass
-        wrapper = K_associative_cache(self, associativity=1)
-        wrapper.build()
-        self.cache_wrapper = wrapper
-        # also set self.cache for compatibility with other code
-        self.cache = wrapper
-        try:
-            nb = getattr(self.cache, 'num_blocks', None) or (getattr(self.cache, 'cache').num_blocks if hasattr(self.cache, 'cache') else None)
-            if nb is None:
-                nb = max(1, int(self.cache_size.get()))
-        except Exception:
-            nb = max(1, int(self.cache_size.get()))
-        self.create_frame_labels(nb)
-        try:
-            self.update_replacement_controls()
-        except Exception:
-            pass
-        try:
-            self.update_rep_set_choices()
-            self.update_replacement_panel()
-        except Exception:
-            pass
+        self._build_associative(1, 'Direct-Mapped')
 
     def two_set_associative_algorithm(self):
-        self.associativity.set(2)
-        self.cache_type.set('2-Way Set')
-        try:
-            self._ensure_ram_object()
-        except Exception:
-            pass
-        wrapper = K_associative_cache(self, associativity=2)
-        wrapper.build()
-        self.cache_wrapper = wrapper
-        self.cache = wrapper
-        try:
-            nb = getattr(self.cache, 'num_blocks', None) or (getattr(self.cache, 'cache').num_blocks if hasattr(self.cache, 'cache') else None)
-            if nb is None:
-                nb = max(1, int(self.cache_size.get()))
-        except Exception:
-            nb = max(1, int(self.cache_size.get()))
-        self.create_frame_labels(nb)
-        try:
-            self.update_replacement_controls()
-        except Exception:
-            pass
-        try:
-            self.update_rep_set_choices()
-            self.update_replacement_panel()
-        except Exception:
-            pass
+        self._build_associative(2, '2-Way Set')
 
     def four_set_associative_algorithm(self):
-        self.associativity.set(4)
-        self.cache_type.set('4-Way Set')
+        self._build_associative(4, '4-Way Set')
+
+    def _build_associative(self, k: int, label: str):
+        """Install a k-way K_associative_cache and rebuild the cache labels."""
+        self.associativity.set(k)
+        self.cache_type.set(label)
         try:
             self._ensure_ram_object()
         except Exception:
             pass
-        wrapper = K_associative_cache(self, associativity=4)
+        wrapper = K_associative_cache(self, associativity=k)
         wrapper.build()
-        self.cache_wrapper = wrapper
-        self.cache = wrapper
+        self._set_cache_wrapper(wrapper)
         try:
             nb = getattr(self.cache, 'num_blocks', None) or (getattr(self.cache, 'cache').num_blocks if hasattr(self.cache, 'cache') else None)
             if nb is None:
@@ -2291,27 +2435,18 @@ class UserInterface:
         any k in the range [1, num_blocks].
         """
         # Validate UI fields before building cache. Abort if invalid instead of
-        # silently clamping so the user can correct the inputs.
+        # silently clamping so the user can correct the inputs. The clamp
+        # covers every check validate_ui_params makes, so it is the only pass.
+        params = self._clamp_ui_values()
+        if params is False:
+            self._append_log('Apply aborted due to invalid UI parameters')
+            return
+        cs, ls, k = params
         try:
-            ok = self._clamp_ui_values()
-            if ok is False:
-                self._append_log('Apply aborted due to invalid UI parameters')
-                return
+            self._set_controls_enabled(True)
         except Exception:
             pass
-        try:
-            k = max(1, int(self.associativity.get()))
-        except Exception:
-            k = 1
-        # Validate UI params and warn if something looks off
-        try:
-            ok = self.validate_ui_params()
-            if not ok:
-                self._append_log('Invalid parameters - fix inputs before applying')
-                return
-        except Exception:
-            pass
-        # Build K-associative wrapper
+        # Build K-associative wrapper
         try:
             # ensure RAM backing store matches UI before building cache
             try:
@@ -2321,20 +2456,11 @@ class UserInterface:
             self.cache_type.set(f"{k}-Way Set" if k != 1 else 'Direct-Mapped')
             wrapper = K_associative_cache(self, associativity=k)
             wrapper.build()
-            self.cache_wrapper = wrapper
-            # also keep self.cache for compatibility
-            self.cache = wrapper
-            # create UI frame labels according to number of blocks
-            try:
-                # compute number of blocks explicitly from UI fields to avoid
-                # accidental dependence on wrapper internals; associativity
-                # should not change the number of cache frames.
-                raw_cache_size = max(1, int(self.cache_size.get()))
-                line_size = max(1, int(self.line_size.get()))
-                nb = max(1, raw_cache_size // line_size)
-            except Exception:
-                nb = max(1, int(self.cache_size.get()))
-            self.create_frame_labels(nb)
+            self._set_cache_wrapper(wrapper)
+            # create UI frame labels according to number of blocks, computed
+            # from the validated UI fields to avoid accidental dependence on
+            # wrapper internals; associativity does not change the frame count.
+            self.create_frame_labels(max(1, cs // ls))
             try:
                 self.update_replacement_controls()
             except Exception:
@@ -2344,12 +2470,8 @@ class UserInterface:
                 self.update_replacement_panel()
             except Exception:
                 pass
-            # reset manual token state when a new cache is built
-            try:
-                self._manual_tokens = []
-                self._manual_index = 0
-            except Exception:
-                pass
+            # re-parse the manual input for the new cache
+            self._manual_dirty = True
         except Exception as e:
             try:
                 self._append_log(f"Error applying associativity {k}: {e}")
@@ -2362,6 +2484,9 @@ class UserInterface:
         This prevents users from creating extremely large caches or entering
         addresses that won't fit the configured address width. We log when
         values are clamped so users see what happened.
+
+        Returns (cache_size, line_size, associativity) as validated when the
+        critical fields are acceptable, False otherwise.
         """
         try:
             # For critical cache parameters (cache_size, line_size, associativity,
@@ -2371,13 +2496,6 @@ class UserInterface:
                 cs = int(self.cache_size.get())
             except Exception:
                 cs = 1
-            if cs < 1:
-                messagebox.showerror('Invalid parameter', 'Cache size must be >= 1')
-                try:
-                    self.cache_size_spinbox.focus_set()
-                except Exception:
-                    pass
-                return False
             if cs > MAX_CACHE_SIZE:
                 messagebox.showerror('Invalid parameter', f'Cache size must be <= {MAX_CACHE_SIZE}. Please change the value.')
                 try:
@@ -2391,13 +2509,6 @@ class UserInterface:
                 bs = int(self.line_size.get())
             except Exception:
                 bs = 1
-            if bs < 1:
-                messagebox.showerror('Invalid parameter', 'Line size must be >= 1')
-                try:
-                    self.line_size_spinbox.focus_set()
-                except Exception:
-                    pass
-                return False
             if bs > MAX_LINE_SIZE:
                 messagebox.showerror('Invalid parameter', f'Line size must be <= {MAX_LINE_SIZE}. Please change the value.')
                 try:
@@ -2406,19 +2517,6 @@ class UserInterface:
                     pass
                 return False
 
-            # require cache_size to be multiple of line_size
-            if cs % bs != 0:
-                msg = f'Cache size ({cs}) is not an exact multiple of line size ({bs}). Please choose values where cache_size is a multiple of line_size.'
-                try:
-                    messagebox.showerror('Cache size / Line size mismatch', msg)
-                except Exception:
-                    pass
-                try:
-                    self.cache_size_spinbox.focus_set()
-                except Exception:
-                    pass
-                return False
-
             # address width
             try:
                 aw = int(self.address_width.get())
@@ -2451,6 +2549,13 @@ class UserInterface:
                 s = MAX_ANIM_SPEED
             self.anim_speed.set(s)
 
+            # steps per tick clamp (non-critical) — clamp silently
+            try:
+                b = int(self.steps_per_tick.get())
+            except Exception:
+                b = 1
+            self.steps_per_tick.set(max(1, min(MAX_STEPS_PER_TICK, b)))
+
             # num_passes clamp (keep small)
             try:
                 p = int(self.num_passes.get())
@@ -2463,52 +2568,29 @@ class UserInterface:
                 p = 10
             self.num_passes.set(p)
 
-            # associativity: ensure it is valid wrt number of blocks
+            # cache size / line size / associativity combination (shared
+            # with validate_ui_params, see _check_params)
             try:
                 assoc = int(self.associativity.get())
             except Exception:
                 assoc = 1
-            if assoc < 1:
-                messagebox.showerror('Invalid parameter', 'Associativity must be >= 1')
-                try:
-                    self.assoc_spinbox.focus_set()
-                except Exception:
-                    pass
-                return False
-            num_blocks = max(1, cs // bs)
-            # also enforce maximum UI blocks here to prevent generating too many
-            if num_blocks > 20:
-                try:
-                    messagebox.showerror('Too many blocks', f'Number of cache blocks ({num_blocks}) exceeds UI display limit (20). Please reduce cache_size or increase line_size.')
-                except Exception:
-                    pass
-                try:
-                    self.assoc_spinbox.focus_set()
-                except Exception:
-                    pass
-                return False
-            if assoc > num_blocks:
-                messagebox.showerror('Invalid parameter', f'Associativity ({assoc}) exceeds number of blocks ({num_blocks}). Please reduce associativity or change cache/line size.')
-                try:
-                    self.assoc_spinbox.focus_set()
-                except Exception:
-                    pass
-                return False
-            if num_blocks % assoc != 0:
-                messagebox.showerror('Invalid parameter', f'Associativity ({assoc}) does not divide the number of blocks ({num_blocks}). Please choose an associativity that evenly divides number of blocks.')
+            ok, code, msg = self._check_params(cs, bs, assoc)
+            if not ok:
+                title, focus = self._PARAM_ERRORS[code]
+                messagebox.showerror(title, msg)
                 try:
-                    self.assoc_spinbox.focus_set()
+                    getattr(self, focus).focus_set()
                 except Exception:
                     pass
                 return False
 
             # everything critical validated
-            return True
+            return cs, bs, assoc
         except Exception:
             return False
 
-    def _ensure_ram_object(self):
-        """Create or update the RAM backing-store object from current UI fields."""
+    def _ram_sig(self) -> tuple:
+        """Return the (size, line_size) the RAM object should have, from the UI fields."""
         try:
             # Clamp RAM size to UI maximum (64) to prevent large drawings / bad input
             size = max(1, int(self.ram_size.get()))
@@ -2520,44 +2602,80 @@ class UserInterface:
             line = max(1, int(self.line_size.get()))
         except Exception:
             line = 1
+        return size, line
+
+    def _ensure_ram_object(self, sig: tuple = None):
+        """Create or update the RAM backing-store object from current UI fields.
+
+        `sig` is a (size, line_size) pair already read by the caller. Nothing
+        is done when it equals the one the current RAM object was made for.
+        """
+        if sig is None:
+            sig = self._ram_sig()
+        if sig == self._last_ram_sig and self.ram_obj is not None:
+            return
+        size, line = sig
+        ram = self.ram_obj
         try:
-            if getattr(self, 'ram_obj', None) is None:
-                self.ram_obj = RAM(size_bytes=size, line_size=line)
-            else:
-                # recreate if size changed
-                if getattr(self.ram_obj, 'size', None) != size or getattr(self.ram_obj, 'line_size', None) != line:
-                    self.ram_obj = RAM(size_bytes=size, line_size=line)
+            # recreate if size or line size changed
+            if ram is None or ram.size != size or ram.line_size != line:
+                self.ram_obj = ram = RAM(size_bytes=size, line_size=line)
+                self._ram_line_size = line = ram.line_size
+                self._line_mask = ~(line - 1) if line & (line - 1) == 0 else None
+            self._last_ram_sig = sig
         except Exception:
             # best-effort: leave ram_obj None on failure
-            try:
-                self.ram_obj = None
-            except Exception:
-                pass
+            self.ram_obj = None
+            self._line_mask = None
 
     def _on_ram_changed(self, *args):
         """Handler called when the RAM size spinbox changes.
 
-        Recreate the RAM backing store (if needed) and refresh the RAM view.
+        Typing "1024" passes through "1", "10" and "102", so the actual work
+        (_on_ram_changed_impl) runs once PARAMS_DEBOUNCE_MS after the last edit.
         """
-        try:
-            # ensure the internal ram object matches the UI fields
-            self._ensure_ram_object()
-            # purge any recorded recent accesses (they may map to old size)
+        # address width may follow the RAM size
+        self._invalidate_geom()
+        self._ram_after_id = self._debounce(self._ram_after_id, self._on_ram_changed_impl)
+
+    def _debounce(self, after_id, func, delay_ms: int = PARAMS_DEBOUNCE_MS):
+        """Cancel the pending `after_id` and schedule `func` `delay_ms` from now.
+
+        Returns the new after() id, or None when `func` had to run immediately.
+        """
+        if after_id is not None:
             try:
-                self._recent_ram_accesses = []
+                self.window.after_cancel(after_id)
             except Exception:
                 pass
+        try:
+            return self.window.after(delay_ms, func)
+        except Exception:
+            func()
+            return None
+
+    def _on_ram_changed_impl(self):
+        """Recreate the RAM backing store (if needed) and refresh the RAM view."""
+        self._ram_after_id = None
+        # the edit may have ended where it started (or the params handler
+        # already rebuilt RAM): then there is nothing to recreate or log
+        sig = self._ram_sig()
+        if sig == self._last_ram_sig and self.ram_obj is not None:
+            return
+        self._invalidate_geom()
+        try:
+            # ensure the internal ram object matches the UI fields
+            self._ensure_ram_object(sig)
+            # purge any recorded recent accesses (they may map to old size)
+            self._recent_ram_accesses.clear()
+            self._touch_ram_view()
             try:
                 self.update_ram_display()
             except Exception:
                 pass
-            try:
-                size = getattr(self.ram_obj, 'size', None)
-                line = getattr(self.ram_obj, 'line_size', None)
-                if size is not None:
-                    self._append_log(f"RAM recreated: size={size} bytes, line_size={line}")
-            except Exception:
-                pass
+            ram = self.ram_obj
+            if ram is not None:
+                self._append_log(f"RAM recreated: size={ram.size} bytes, line_size={ram.line_size}")
         except Exception:
             pass
 
@@ -2579,43 +2697,32 @@ class UserInterface:
         if core is None:
             return
 
-        # update core object's policy (best-effort)
-        try:
-            core.write_policy = wp
-        except Exception:
-            pass
-
-        # If switching to write-through, flush dirty lines to RAM and clear them
-        if wp == 'write-through':
-            try:
-                line_size = int(getattr(core, 'line_size', 1) or 1)
-                num_sets = int(getattr(core, 'num_sets', 1) or 1)
-                for s in range(len(core.sets)):
-                    for w in range(len(core.sets[s])):
-                        block = core.sets[s][w]
-                        try:
-                            if getattr(block, 'dirty', False):
-                                # compute evicted block base and write to RAM
-                                try:
-                                    tag = int(block.tag)
-                                    block_addr = tag * num_sets + int(s)
-                                    base = block_addr * line_size
-                                except Exception:
-                                    base = None
-                                try:
-                                    if base is not None and getattr(self, 'ram_obj', None) is not None:
-                                        try:
-                                            self.ram_obj.write(base, 1)
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
-                                try:
-                                    block.dirty = False
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
+        # update core object's policy
+        core.write_policy = wp
+
+        # If switching to write-through, flush dirty lines to RAM and clear
+        # them; the core counts its dirty blocks, so a clean cache is not scanned
+        if wp == 'write-through' and getattr(core, 'dirty_count', 1):
+            try:
+                geom = self._get_cache_geom(core)
+                tag_stride = geom['tag_stride']
+                set_base = geom['set_base']
+                ram = self.ram_obj
+                set_dirty = core.set_dirty
+                for k, block in enumerate(geom['flat_blocks']):
+                    if block.dirty:
+                        # compute evicted block base and write to RAM
+                        if ram is not None:
+                            base = block.tag * tag_stride + set_base[k]
+                            # addresses can exceed the (small) RAM; RAM.write
+                            # raises for those, which must not stop the flush
+                            try:
+                                ram.write(base, 1)
+                            except (IndexError, TypeError):
+                                pass
+                            else:
+                                self._mark_ram_dirty(base)
+                        set_dirty(block, False)
             except Exception:
                 pass
 
@@ -2628,34 +2735,71 @@ class UserInterface:
     def _note_ram_access(self, addr: int, is_write: bool):
         """Record a recent RAM access (base-aligned) for temporary highlighting.
 
-        We store tuples (base_addr, is_write, expiry_ts) and purge expired
-        entries during drawing.
+        Writes and reads are stored as RamAccess entries colored
+        RAM_WRITE_COLOR / RAM_READ_COLOR; expired entries are purged here and
+        during drawing.
         """
         try:
-            if addr is None or getattr(self, 'ram_obj', None) is None:
+            ram = self.ram_obj
+            if addr is None or ram is None:
                 return
-            try:
-                line = max(1, int(getattr(self.ram_obj, 'line_size', 1)))
-            except Exception:
-                line = 1
-            base = (int(addr) // line) * line
+            # line size and mask are memoized when ram_obj is built
+            addr = int(addr)
+            mask = self._line_mask
+            base = addr & mask if mask is not None else addr - addr % self._ram_line_size
             # highlight duration synchronized with animation speed (anim_speed in ms)
             # highlight duration: keep it short (1 second) so highlights are transient
-            expiry = time.time() + 1.0
-            # append and keep list small
-            try:
-                self._recent_ram_accesses.append((base, bool(is_write), expiry))
-            except Exception:
-                self._recent_ram_accesses = [(base, bool(is_write), expiry)]
-            # purge expired entries immediately to bound memory
-            now = time.time()
-            try:
-                self._recent_ram_accesses = [(b, w, e) for (b, w, e) in self._recent_ram_accesses if e > now]
-            except Exception:
-                pass
+            expiry = time.monotonic() + 1.0
+            if is_write:
+                self._mark_ram_dirty(base)
+            self._push_recent_ram(base, RAM_WRITE_COLOR if is_write else RAM_READ_COLOR, expiry)
+        except Exception:
+            pass
+
+    def _push_recent_ram(self, base: int, color: str, expiry: float):
+        """Append a RAM highlight and drop the expired ones from the left.
+
+        Expiries are always now + a fixed duration, so the deque stays ordered
+        by expiry and purging only has to look at its left end.
+        """
+        q = self._recent_ram_accesses
+        self._touch_ram_view(base)
+        if len(q) == q.maxlen:
+            # the append below pushes out the oldest highlight; repaint its row
+            self._touch_ram_view(q[0].base)
+        q.append(RamAccess(base, color, expiry))
+        now = time.monotonic()
+        while q and q[0].expiry <= now:
+            # the expired highlight's row still shows it until repainted
+            self._touch_ram_view(q.popleft().base)
+        self._ensure_sweep()
+
+    def _ensure_sweep(self):
+        """Start the _sweep_transients timer unless it is already pending."""
+        if self._sweep_id is not None:
+            return
+        try:
+            self._sweep_id = self.window.after(TRANSIENT_SWEEP_MS, self._sweep_transients)
         except Exception:
+            # no event loop: expired highlights are dropped while drawing
             pass
 
+    def _sweep_transients(self):
+        """Repaint expired RAM highlights.
+
+        Reschedules itself while highlights are outstanding, so the timer is
+        idle once nothing is left to expire.
+        """
+        self._sweep_id = None
+        now = time.monotonic()
+        q = self._recent_ram_accesses
+        if q and q[0].expiry <= now:
+            while q and q[0].expiry <= now:
+                self._touch_ram_view(q.popleft().base)
+            self._schedule_ram_redraw()
+        if q:
+            self._ensure_sweep()
+
     def _note_ram_access_color(self, base: int, color: str, duration_ms: int = None):
         """Record a recent RAM access with an explicit color string.
 
@@ -2666,18 +2810,8 @@ class UserInterface:
             if base is None or getattr(self, 'ram_obj', None) is None:
                 return
             # fixed short duration for visual clarity: 1 second
-            expiry = time.time() + 1.0
-            try:
-                # store color string as second element; update_ram_display understands both bool and str
-                self._recent_ram_accesses.append((base, str(color), expiry))
-            except Exception:
-                self._recent_ram_accesses = [(base, str(color), expiry)]
-            # purge expired entries
-            now = time.time()
-            try:
-                self._recent_ram_accesses = [(b, w, e) for (b, w, e) in self._recent_ram_accesses if e > now]
-            except Exception:
-                pass
+            expiry = time.monotonic() + 1.0
+            self._push_recent_ram(base, str(color), expiry)
         except Exception:
             pass
 
@@ -2706,59 +2840,28 @@ class UserInterface:
         except Exception:
             core = None
 
-        # Attempt to read from cache block data first
-        try:
-            line_size = getattr(core, 'line_size', None) or max(1, int(self.line_size.get()))
-        except Exception:
-            try:
-                line_size = max(1, int(self.line_size.get()))
-            except Exception:
-                line_size = 1
-
-        try:
-            block_addr = addr // line_size
-            offset = addr % line_size
-        except Exception:
-            block_addr = None
-            offset = 0
-
+        # Attempt to read from cache block data first; the geometry is
+        # computed once per cache (see _get_cache_geom), not per access
         try:
-            if core is not None and hasattr(core, 'num_sets') and hasattr(core, 'sets') and block_addr is not None:
-                num_sets = getattr(core, 'num_sets', 1) or 1
-                set_index = block_addr % num_sets
-                tag = block_addr // num_sets
+            if core is not None and hasattr(core, 'num_sets') and hasattr(core, 'sets'):
+                geom = self._get_cache_geom(core)
+                offset = addr % geom['line_size']
+                set_index, tag = core.decode(addr)
                 if 0 <= set_index < len(core.sets):
-                    # search for a way with matching tag
-                    for w in range(len(core.sets[set_index])):
-                        candidate = core.sets[set_index][w]
-                        try:
-                            if getattr(candidate, 'valid', False) and getattr(candidate, 'tag', None) == tag:
-                                if getattr(candidate, 'data', None) is not None:
-                                    try:
-                                        val = candidate.data[offset]
-                                    except Exception:
-                                        val = None
-                                break
-                        except Exception:
-                            continue
+                    # the core keeps a tag -> way index per set
+                    w = core.find_way(set_index, tag)
+                    if w is not None:
+                        data = core.sets[set_index][w].data
+                        if data is not None and offset < len(data):
+                            val = data[offset]
         except Exception:
             val = None
 
         # fallback to RAM
-        if val is None:
+        ram = self.ram_obj
+        if val is None and ram is not None:
             try:
-                ram = getattr(self, 'ram_obj', None)
-                if ram is None:
-                    if getattr(self, 'last_read_value', None) is not None:
-                        try:
-                            self.last_read_value.set('N/A')
-                        except Exception:
-                            pass
-                    return
-                try:
-                    val = ram.read(addr)
-                except Exception:
-                    val = None
+                val = ram.read(addr)
             except Exception:
                 val = None
 
@@ -2767,9 +2870,12 @@ class UserInterface:
                 self.last_read_value.set('N/A')
             else:
                 try:
-                    self.last_read_value.set(f"{int(val)} (0x{int(val):02x})")
-                except Exception:
-                    self.last_read_value.set(str(val))
+                    v = int(val)
+                except (TypeError, ValueError):
+                    text = str(val)
+                else:
+                    text = f"{v} (0x{v:02x})"
+                self.last_read_value.set(text)
         except Exception:
             pass
 
@@ -2779,114 +2885,14 @@ class UserInterface:
         This method is defensive: if a control doesn't exist yet we ignore it.
         """
         state = 'normal' if enabled else 'disabled'
-        try:
-            if hasattr(self, 'read_next_btn') and self.read_next_btn is not None:
-                try:
-                    self.read_next_btn.configure(state=state)
-                except Exception:
-                    pass
-            if hasattr(self, 'write_next_btn') and self.write_next_btn is not None:
-                try:
-                    self.write_next_btn.configure(state=state)
-                except Exception:
-                    pass
-            if hasattr(self, 'run_button') and self.run_button is not None:
-                try:
-                    self.run_button.configure(state=state)
-                except Exception:
-                    pass
-            if hasattr(self, 'apply_assoc_btn') and self.apply_assoc_btn is not None:
-                try:
-                    self.apply_assoc_btn.configure(state=state)
-                except Exception:
-                    pass
-            # playback controls
-            if hasattr(self, 'play_btn') and self.play_btn is not None:
-                try:
-                    self.play_btn.configure(state=state)
-                except Exception:
-                    pass
-            if hasattr(self, 'pause_btn') and self.pause_btn is not None:
-                try:
-                    self.pause_btn.configure(state=state)
-                except Exception:
-                    pass
-            if hasattr(self, 'step_btn') and self.step_btn is not None:
-                try:
-                    self.step_btn.configure(state=state)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-    def _animate_ram_to_cache(self, base_addr: int, label_index: int):
-        """Visualize a RAM -> cache load by highlighting the RAM cell and the cache label.
-
-        This is a lightweight animation: we draw a temporary outline around the
-        RAM cell and flash the destination cache label background for a short
-        duration determined by half the animation speed.
-        """
-        try:
-            canvas = getattr(self, 'ram_canvas', None)
-            if canvas is None:
-                return
-            bbox = getattr(self, '_ram_cell_bboxes', {}).get(base_addr)
-            rect_id = None
-            try:
-                if bbox:
-                    x1, y1, x2, y2 = bbox
-                    rect_id = canvas.create_rectangle(x1, y1, x2, y2, outline='#FFD54F', width=3)
-            except Exception:
-                rect_id = None
-
-            lbl = None
-            orig_bg = None
-            try:
-                if 0 <= int(label_index) < len(getattr(self, 'frame_labels', [])):
-                    lbl = self.frame_labels[int(label_index)]
-                    try:
-                        orig_bg = lbl.cget('bg')
-                    except Exception:
-                        orig_bg = None
-                    try:
-                        lbl.configure(bg='#FFD54F')
-                    except Exception:
-                        pass
-            except Exception:
-                lbl = None
-
-            def _clear_anim():
-                try:
-                    if rect_id is not None:
-                        try:
-                            canvas.delete(rect_id)
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+        for name in self._CONTROL_ATTRS:
+            w = getattr(self, name, None)
+            if w is not None:
                 try:
-                    if lbl is not None:
-                        try:
-                            if orig_bg is not None:
-                                lbl.configure(bg=orig_bg)
-                            else:
-                                lbl.configure(bg='#111111')
-                        except Exception:
-                            pass
+                    w.configure(state=state)
                 except Exception:
                     pass
 
-            try:
-                dur = max(200, int(self.anim_speed.get()) // 2)
-            except Exception:
-                dur = 400
-            try:
-                self.window.after(dur, _clear_anim)
-            except Exception:
-                _clear_anim()
-        except Exception:
-            pass
-
     def _ensure_valid_or_warn(self) -> bool:
         """Validate UI parameters and show a popup if invalid.
 
@@ -2909,34 +2915,114 @@ class UserInterface:
             return False
 
     def _ensure_input_bindings(self):
-        """Ensure the Input Entry has trace and key bindings so typing always updates the decode preview.
+        """Ensure the Input Entry has a variable trace so typing always updates the decode preview.
 
         This is idempotent and safe to call multiple times; some tkinter versions
         expose trace_add while others use trace('w'), so we attempt both.
         """
+        if self._input_bindings_done:
+            return
         try:
             ent = getattr(self, 'input_entry', None)
             if ent is None:
                 return
-            # variable trace
+            # variable traces: decode preview and re-parse on the next access
             try:
-                # remove previous traces is tricky; we simply add a trace which is lightweight
-                self.input.trace_add('write', lambda *a: self.update_decode_panel())
+                self.input.trace_add('write', self._on_input_written)
             except Exception:
                 try:
-                    self.input.trace('w', lambda *a: self.update_decode_panel())
+                    self.input.trace('w', self._on_input_written)
                 except Exception:
                     pass
-            # key event on the Entry itself
+            values = getattr(self, 'write_values', None)
+            if values is not None:
+                try:
+                    values.trace_add('write', self._on_values_written)
+                except Exception:
+                    try:
+                        values.trace('w', self._on_values_written)
+                    except Exception:
+                        pass
+            # the Input trace fires for every edit, so no <KeyRelease>
+            # binding is needed (it also fired for cursor keys)
+            self._input_bindings_done = True
+        except Exception:
+            pass
+
+    def _on_input_written(self, *_):
+        """Trace callback of the Input variable.
+
+        Edits by the user mark the manual tokens for re-parsing; rewrites by
+        _flush_entry_text do not, since they only drop consumed tokens.
+        """
+        if not self._syncing_entries:
+            self._manual_dirty = True
+        self._schedule_decode_panel()
+
+    def _on_values_written(self, *_):
+        """Trace callback of the Write values variable (see _on_input_written)."""
+        if not self._syncing_entries:
+            self._values_dirty = True
+
+    def _schedule_entry_flush(self, values: bool = False):
+        """Rewrite the Input (and, with `values`, Write values) entry ENTRY_FLUSH_MS from now.
+
+        Requests made before the rewrite runs are merged into it.
+        """
+        self._input_text_stale = True
+        if values:
+            self._values_text_stale = True
+        if self._entry_flush_id is None:
             try:
-                ent.bind('<KeyRelease>', lambda e: self.update_decode_panel())
+                self._entry_flush_id = self.window.after(ENTRY_FLUSH_MS, self._flush_entry_text)
+            except Exception:
+                self._flush_entry_text()
+
+    def _flush_entry_text(self):
+        """Show the remaining raw tokens in the Input / Write values entries.
+
+        Only entries marked stale by _schedule_entry_flush are set, so a
+        read does not rewrite (and re-trace) the Write values entry. An entry
+        the user edited since the tokens were parsed is left alone: its text
+        is re-parsed on the next access instead.
+        """
+        if self._entry_flush_id is not None:
+            try:
+                self.window.after_cancel(self._entry_flush_id)
             except Exception:
                 pass
+            self._entry_flush_id = None
+        input_stale, self._input_text_stale = self._input_text_stale, False
+        values_stale, self._values_text_stale = self._values_text_stale, False
+        self._syncing_entries = True
+        try:
+            if input_stale and not self._manual_dirty:
+                # the Input trace also refreshes the decode preview
+                self.input.set(','.join(self._manual_raw_tokens))
+            if values_stale and not self._values_dirty:
+                self.write_values.set(','.join(self._value_raw_tokens))
         except Exception:
             pass
+        finally:
+            self._syncing_entries = False
 
     def _on_params_changed(self):
-        """Called when cache_size/line_size/associativity change to re-validate params."""
+        """Called when cache_size/line_size/associativity change to re-validate params.
+
+        Revalidation and redraw (_on_params_changed_impl) run once
+        PARAMS_DEBOUNCE_MS after the last edit, so intermediate keystroke
+        values neither redraw the views nor pop up warnings. The three
+        parameter traces share the one pending timer (_params_after_id), so
+        edits to different fields within the quiet period are validated
+        together.
+        """
+        self._invalidate_geom()
+        self._params_after_id = self._debounce(self._params_after_id, self._on_params_changed_impl)
+
+    def _on_params_changed_impl(self):
+        """Re-validate the cache parameters and redraw the cache and RAM views."""
+        self._params_after_id = None
+        self._invalidate_geom()
         try:
             ok = self.validate_ui_params()
             # When line_size changes we need the RAM backing-store to reflect
@@ -2948,7 +3034,28 @@ class UserInterface:
             except Exception:
                 pass
             try:
-                # recompute cache->RAM mapping and redraw views
+                raw_cache_size = max(1, int(self.cache_size.get()))
+            except Exception:
+                raw_cache_size = 1
+            try:
+                line_size = max(1, int(self.line_size.get()))
+            except Exception:
+                line_size = 1
+            try:
+                assoc = max(1, int(self.associativity.get()))
+            except Exception:
+                assoc = 1
+            num_blocks = max(1, raw_cache_size // line_size)
+            num_sets = max(1, num_blocks // assoc)
+            # recompute cache->RAM mapping and redraw views, unless nothing they
+            # depend on changed since the last time (e.g. an edit that was undone)
+            try:
+                core = self.get_core_cache()
+            except Exception:
+                core = None
+            sig = (num_blocks, num_sets, line_size, raw_cache_size, core, self.ram_obj)
+            if sig != self._last_display_sig:
+                self._last_display_sig = sig
                 try:
                     # update cache display (will call update_ram_display)
                     self.update_cache_display({})
@@ -2957,30 +3064,11 @@ class UserInterface:
                         self.update_ram_display()
                     except Exception:
                         pass
-            except Exception:
-                pass
             # validate_ui_params will enable controls if ok; if not, keep them disabled
             # also update live block/set labels even if we didn't recreate frames
             try:
-                try:
-                    raw_cache_size = max(1, int(self.cache_size.get()))
-                except Exception:
-                    raw_cache_size = 1
-                try:
-                    line_size = max(1, int(self.line_size.get()))
-                except Exception:
-                    line_size = 1
-                num_blocks = max(1, raw_cache_size // line_size)
-                try:
-                    assoc = max(1, int(self.associativity.get()))
-                except Exception:
-                    assoc = 1
-                num_sets = max(1, num_blocks // assoc)
-                try:
-                    self.num_blocks_var.set(str(int(num_blocks)))
-                    self.num_sets_var.set(str(int(num_sets)))
-                except Exception:
-                    pass
+                self.num_blocks_var.set(str(num_blocks))
+                self.num_sets_var.set(str(num_sets))
             except Exception:
                 pass
             return ok
@@ -2991,6 +3079,9 @@ class UserInterface:
         """Validate UI parameter combinations and alert the user for problematic inputs.
 
         Returns True if parameters are acceptable (warnings may still have been shown).
+        The result is remembered for the last (cache_size, line_size,
+        associativity) checked; asking again for the same values returns it
+        without re-running the checks or showing the warnings again.
         """
         try:
             cs = int(self.cache_size.get())
@@ -3004,469 +3095,297 @@ class UserInterface:
             assoc = int(self.associativity.get())
         except Exception:
             assoc = 1
-
-        # basic invalid cases
-        if ls <= 0:
-            messagebox.showwarning('Invalid parameter', 'Line size must be >= 1')
-            try:
-                self._set_controls_enabled(False)
-            except Exception:
-                pass
-            return False
-        if cs <= 0:
-            messagebox.showwarning('Invalid parameter', 'Cache size must be >= 1')
-            try:
-                self._set_controls_enabled(False)
-            except Exception:
-                pass
-            return False
-
+        key = (cs, ls, assoc)
+        if key == self._validate_cache[0]:
+            return self._validate_cache[1]
+        ok = self._check_ui_params(cs, ls, assoc)
+        self._validate_cache = (key, ok)
+        return ok
+
+    @staticmethod
+    def _check_params(cs: int, ls: int, assoc: int) -> tuple:
+        """Check a (cache_size, line_size, associativity) combination without any Tk work.
+
+        Returns (True, None, None) when it is usable, otherwise (False, code,
+        message) where `code` is a key of _PARAM_ERRORS.
+        """
+        if ls < 1:
+            return False, 'line_size', 'Line size must be >= 1'
+        if cs < 1:
+            return False, 'cache_size', 'Cache size must be >= 1'
         # cache size must be exact multiple of line size for simplicity
         if cs % ls != 0:
-            msg = (
-                f'Cache size ({cs}) is not an exact multiple of line size ({ls}).\n'
+            return False, 'cs_multiple', (
+                f'Cache size ({cs}) is not an exact multiple of line size ({ls}). '
                 'Please choose values where cache_size is a multiple of line_size.'
             )
-            try:
-                messagebox.showwarning('Cache size / Line size mismatch', msg)
-            except Exception:
-                pass
-            self._append_log(msg)
-            try:
-                self._set_controls_enabled(False)
-            except Exception:
-                pass
-            return False
-
-        # compute number of blocks and warn if associativity > blocks
-        num_blocks = max(1, cs // ls)
-        # UI display limit: refuse configurations that would create more than 20 blocks
-        if num_blocks > 20:
-            msg = f'Number of cache blocks ({num_blocks}) exceeds UI display limit (20).\nPlease reduce cache_size or increase line_size.'
-            try:
-                messagebox.showerror('Too many blocks', msg)
-            except Exception:
-                pass
-            try:
-                self._set_controls_enabled(False)
-            except Exception:
-                pass
-            return False
+        num_blocks = cs // ls
+        if num_blocks > MAX_CACHE_BLOCKS:
+            return False, 'too_many_blocks', (
+                f'Number of cache blocks ({num_blocks}) exceeds UI display limit ({MAX_CACHE_BLOCKS}). '
+                'Please reduce cache_size or increase line_size.'
+            )
+        if assoc < 1:
+            return False, 'assoc', 'Associativity must be >= 1'
         if assoc > num_blocks:
-            msg = f'Associativity ({assoc}) exceeds number of blocks ({num_blocks}). Please reduce associativity or increase cache/line size.'
-            try:
-                messagebox.showwarning('Associativity too large', msg)
-            except Exception:
-                pass
-            self._append_log(msg)
-            try:
-                self._set_controls_enabled(False)
-            except Exception:
-                pass
-            return False
-
+            return False, 'assoc_gt_blocks', (
+                f'Associativity ({assoc}) exceeds number of blocks ({num_blocks}). '
+                'Please reduce associativity or increase cache/line size.'
+            )
         # ensure associativity divides number of blocks (otherwise mapping is ambiguous)
         if num_blocks % assoc != 0:
-            msg = f'Associativity ({assoc}) does not divide the number of blocks ({num_blocks}). Please choose an associativity that evenly divides number of blocks.'
-            try:
-                messagebox.showwarning('Associativity mismatch', msg)
-            except Exception:
-                pass
-            self._append_log(msg)
-            try:
-                self._set_controls_enabled(False)
-            except Exception:
-                pass
-            return False
-
-        # all good -> enable controls
-        try:
-            self._set_controls_enabled(True)
-        except Exception:
-            pass
-        return True
+            return False, 'assoc_divisor', (
+                f'Associativity ({assoc}) does not divide the number of blocks ({num_blocks}). '
+                'Please choose an associativity that evenly divides number of blocks.'
+            )
+        return True, None, None
 
-    def _draw_ram_to_cache_arrow(self, base_addr: int, label_index: int, color: str = '#FFD54F', duration: int = 400):
-        """Draw a temporary arrow from the RAM cell (base_addr) to the cache label (label_index).
+    def _check_ui_params(self, cs: int, ls: int, assoc: int) -> bool:
+        """Run the validate_ui_params checks for the given values (uncached).
 
-        The arrow is drawn on a short-lived overlay canvas placed over the
-        cache/RAM right panel so it visually connects the two widgets.
+        A failed check is shown as a warning and logged; the controls are
+        enabled or disabled to match the result.
         """
-        try:
-            # need the source bbox (in ram_canvas coords)
-            canvas = getattr(self, 'ram_canvas', None)
-            lbl = None
-            try:
-                if 0 <= int(label_index) < len(getattr(self, 'frame_labels', [])):
-                    lbl = self.frame_labels[int(label_index)]
-            except Exception:
-                lbl = None
-            if canvas is None or lbl is None:
-                return
-
-            # parent for overlay: choose the common ancestor container where both
-            # ram_canvas and cache labels reside. cache_display_frame is in container_right,
-            # so use its parent (container_right) if available, else use self.window.
-            parent = getattr(self, 'cache_display_frame', None)
-            if parent is not None:
-                parent = parent.master or self.window
-            else:
-                parent = self.window
-
-            # ensure geometry info is up-to-date
+        ok, code, msg = self._check_params(cs, ls, assoc)
+        if not ok:
             try:
-                parent.update_idletasks()
+                messagebox.showwarning(self._PARAM_ERRORS[code][0], msg)
             except Exception:
                 pass
-
-            # compute parent origin (root coords)
-            try:
-                p_rootx = parent.winfo_rootx()
-                p_rooty = parent.winfo_rooty()
-            except Exception:
-                p_rootx = self.window.winfo_rootx()
-                p_rooty = self.window.winfo_rooty()
-
-            # source center: ram_canvas root + bbox center, then convert to parent coords
-            try:
-                r_rootx = canvas.winfo_rootx()
-                r_rooty = canvas.winfo_rooty()
-                bbox = getattr(self, '_ram_cell_bboxes', {}).get(base_addr)
-                if not bbox:
-                    return
-                x1, y1, x2, y2 = bbox
-                src_x = (r_rootx - p_rootx) + (x1 + x2) / 2
-                src_y = (r_rooty - p_rooty) + (y1 + y2) / 2
-            except Exception:
-                return
-
-            # destination center: label root coordinates converted to parent coords
-            try:
-                lbl_rootx = lbl.winfo_rootx()
-                lbl_rooty = lbl.winfo_rooty()
-                dst_x = (lbl_rootx - p_rootx) + lbl.winfo_width() / 2
-                dst_y = (lbl_rooty - p_rooty) + lbl.winfo_height() / 2
-            except Exception:
-                return
-
-            # create overlay canvas in parent
-            try:
-                ov = tk.Canvas(parent, width=parent.winfo_width() or 800, height=parent.winfo_height() or 400, bg=self.background_container, highlightthickness=0)
-                # place exactly over parent
-                ov.place(x=0, y=0, relwidth=1, relheight=1)
-                ov.lift()
-                # draw a smooth arrow
-                arrow_id = ov.create_line(src_x, src_y, dst_x, dst_y, fill=color, width=3, arrow='last', smooth=True)
-            except Exception:
-                try:
-                    ov = None
-                except Exception:
-                    ov = None
-                arrow_id = None
-
-            def _cleanup():
-                try:
-                    if ov is not None:
-                        try:
-                            ov.delete('all')
-                        except Exception:
-                            pass
-                        try:
-                            ov.place_forget()
-                        except Exception:
-                            try:
-                                ov.destroy()
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
-
-            try:
-                self.window.after(max(150, int(duration)), _cleanup)
-            except Exception:
-                _cleanup()
-        except Exception:
-            pass
+            self._append_log(msg)
+        self._set_controls_enabled(ok)
+        return ok
 
     # --- Manual input consumption helpers ---
-    def _prepare_manual_tokens(self):
+    def _prepare_manual_tokens(self) -> None:
         """Parse the Input field into a list of integer addresses for manual mode.
 
         This ignores any R:/W: prefixes — the Read/Write buttons decide the action.
         """
+        # the entry must not lag behind already consumed tokens
+        if self._entry_flush_id is not None:
+            self._flush_entry_text()
+        self._manual_dirty = False
         try:
             text = (self.input.get() or '').strip()
             if not text:
-                self._manual_tokens = []
-                self._manual_index = 0
+                self._manual_tokens = deque()
+                self._manual_raw_tokens = deque()
                 return
             # split on commas and whitespace
-            raw = [t.strip() for part in text.split(',') for t in part.split() if t.strip()]
-            tokens = []
+            raw = text.replace(',', ' ').split()
+            # parse messages are collected and logged as one entry at the end
+            log_buf = []
             # keep the original raw tokens (for updating the input field as we consume)
-            self._manual_raw_tokens = list(raw)
-            for t in raw:
-                # Expect plain addresses (decimal) or hex with 0x prefix.
-                tval = t
-                try:
-                    # int(..., 0) accepts 0x prefixed hex or decimal
-                    val = int(tval, 0)
-                except Exception:
-                    try:
-                        # final fallback: try decimal
-                        val = int(tval)
-                    except Exception:
-                        self._append_log(f"Skipped invalid token in manual input: {t}")
-                        continue
-                tokens.append(val)
-            # enforce token limit
-            if len(tokens) > MAX_INPUT_TOKENS:
-                self._append_log(f"Manual input truncated to first {MAX_INPUT_TOKENS} tokens")
-                tokens = tokens[:MAX_INPUT_TOKENS]
-            # clamp addresses by address_width
+            self._manual_raw_tokens = deque(raw)
+            # addresses are limited by address_width: negatives are dropped and
+            # large ones clamped, with one log line per kind instead of per token
             try:
                 aw = max(1, int(self.address_width.get()))
             except Exception:
                 aw = MAX_ADDRESS_WIDTH
             max_addr = (1 << min(aw, MAX_ADDRESS_WIDTH)) - 1
-            norm = []
-            for a in tokens:
-                if a < 0:
-                    self._append_log(f"Negative address skipped: {a}")
+            # parse, filter, clamp and truncate in one pass; past the
+            # MAX_INPUT_TOKENS-th address tokens are only checked until one
+            # more valid address shows the input was really truncated
+            limit = MAX_INPUT_TOKENS
+            norm = deque()
+            append = norm.append
+            skipped = clamped = 0
+            truncated = False
+            span = 0
+            for t in raw:
+                if len(norm) == limit:
+                    val = parse_int_token(t)
+                    if val is not None and val >= 0:
+                        truncated = True
+                        break
                     continue
-                if a > max_addr:
-                    self._append_log(f"Address {a} exceeds address width, clamped to {max_addr}")
-                    a = max_addr
-                norm.append(a)
+                span += 1
+                # Expect plain addresses (decimal) or hex with 0x prefix.
+                val = parse_int_token(t)
+                if val is None:
+                    log_buf.append(f"Skipped invalid token in manual input: {t}")
+                    continue
+                if val < 0:
+                    skipped += 1
+                    continue
+                if val > max_addr:
+                    clamped += 1
+                    val = max_addr
+                append((val, span))
+                span = 0
+            if truncated:
+                log_buf.append(f"Manual input truncated to first {MAX_INPUT_TOKENS} tokens")
+            if skipped:
+                log_buf.append(f"{skipped} negative address(es) skipped")
+            if clamped:
+                log_buf.append(f"{clamped} address(es) exceed address width, clamped to {max_addr}")
+            if log_buf:
+                self._append_log('\n'.join(log_buf))
             self._manual_tokens = norm
-            self._manual_index = 0
         except Exception:
-            self._manual_tokens = []
-            self._manual_index = 0
-            self._manual_raw_tokens = []
-        # ensure input bindings are active after parsing user text
-        try:
-            self._ensure_input_bindings()
-        except Exception:
-            pass
+            self._manual_tokens = deque()
+            self._manual_raw_tokens = deque()
 
-    def _prepare_value_tokens(self):
-        """Parse the Write values entry into a list of integer values for manual writes."""
+    def _prepare_value_tokens(self) -> None:
+        """Parse the Write values entry into (value, raw span) pairs for manual writes."""
+        # the entry must not lag behind already consumed tokens
+        if self._entry_flush_id is not None:
+            self._flush_entry_text()
+        self._values_dirty = False
         try:
-            text = (self.write_values.get() or '').strip() if getattr(self, 'write_values', None) is not None else ''
+            text = (self.write_values.get() or '').strip()
             if not text:
-                self._value_tokens = []
-                self._value_index = 0
-                self._value_raw_tokens = []
+                self._value_tokens = deque()
+                self._value_raw_tokens = deque()
                 return
-            raw = [t.strip() for part in text.split(',') for t in part.split() if t.strip()]
-            self._value_raw_tokens = list(raw)
-            vals = []
+            # split on commas and whitespace (same as _prepare_manual_tokens)
+            raw = text.replace(',', ' ').split()
+            # invalid tokens are skipped; nothing past the MAX_INPUT_TOKENS-th
+            # value is parsed
+            vals = deque()
+            span = used = 0
             for t in raw:
-                try:
-                    v = int(t, 0)
-                except Exception:
-                    try:
-                        v = int(t)
-                    except Exception:
-                        # skip invalid tokens
-                        continue
-                vals.append(int(v))
-            # enforce reasonable limit
-            if len(vals) > MAX_INPUT_TOKENS:
-                vals = vals[:MAX_INPUT_TOKENS]
-                self._append_log(f"Write values truncated to first {MAX_INPUT_TOKENS} tokens")
+                if len(vals) == MAX_INPUT_TOKENS:
+                    self._append_log(f"Write values truncated to first {MAX_INPUT_TOKENS} tokens")
+                    break
+                span += 1
+                v = parse_int_token(t)
+                if v is not None:
+                    vals.append((v, span))
+                    used += span
+                    span = 0
+            # raw tokens past the last parsed value are never consumed one by
+            # one, so a long pasted tail is kept as a single string
+            if len(raw) - used > 1:
+                raw[used:] = [','.join(raw[used:])]
+            self._value_raw_tokens = deque(raw)
             self._value_tokens = vals
-            self._value_index = 0
         except Exception:
-            self._value_tokens = []
-            self._value_index = 0
-            self._value_raw_tokens = []
+            self._value_tokens = deque()
+            self._value_raw_tokens = deque()
 
-    def _consume_manual_token(self, is_write: bool):
+    def _consume_manual_token(self, is_write: bool) -> Optional[dict]:
         """Consume next manual token and perform a single access (read or write).
 
         Returns the info dict from the simulator step or None.
         """
+        infos = self._step_batch(1, is_write)
+        return infos[-1] if infos else None
+
+    def _step_batch(self, n: int, is_write: bool) -> list:
+        """Consume up to `n` manual tokens and perform them as reads or writes.
+
+        The accesses are loaded into the simulator at once and stepped back to
+        back; log lines, hit-rate samples and RAM write-throughs are collected
+        per access, but the log is written once and the stats, chart and
+        cache/RAM views are redrawn once at idle time for the last access
+        (_schedule_manual_redraw); the entries are rewritten later by
+        _flush_entry_text.
+
+        Returns the list of info dicts (empty when nothing was performed).
+        """
         try:
             if not self._ensure_valid_or_warn():
-                return None
-            if not hasattr(self, 'cache') or self.cache is None:
+                return []
+            if self.cache is None:
                 self.apply_associativity()
-            if not hasattr(self, '_manual_tokens') or not self._manual_tokens:
+            if self._manual_dirty:
                 self._prepare_manual_tokens()
-            if not getattr(self, '_manual_tokens', None):
+            tokens = self._manual_tokens
+            if not tokens:
                 self._append_log('No manual input tokens available')
-                return None
-            if self._manual_index >= len(self._manual_tokens):
-                self._append_log('No more manual tokens')
-                return None
-            addr = self._manual_tokens[self._manual_index]
-            self._manual_index += 1
-
+                return []
             # Use wrapper's simulator for consistency
-            sim = None
-            if hasattr(self.cache, 'sim') and getattr(self.cache, 'sim') is not None:
-                sim = self.cache.sim
-            elif hasattr(self.cache_wrapper, 'sim') and getattr(self.cache_wrapper, 'sim') is not None:
-                sim = self.cache_wrapper.sim
+            sim = self.get_simulator()
             if sim is None:
                 self._append_log('No simulator available for manual access')
-                return None
-
-            # If this is a manual write, consume the first write value token (if any)
-            # and keep it so we can reuse it after the simulator step (avoid
-            # consuming tokens twice).
-            write_val = None
+                return []
+            addrs = []
+            raw = self._manual_raw_tokens
+            for _ in range(min(max(1, n), len(tokens))):
+                addr, span = tokens.popleft()
+                addrs.append(addr)
+                # drop the raw tokens this address was parsed from
+                for _ in range(min(span, len(raw))):
+                    raw.popleft()
+            count = len(addrs)
+
+            # For manual writes, consume one write value token (if any) per
+            # address and keep them so we can reuse them after the simulator
+            # steps. This is the only place write values and their raw tokens
+            # are consumed; the write-through below reuses write_vals.
+            write_vals = [None] * count
             if is_write:
-                try:
-                    if not getattr(self, '_value_tokens', None):
-                        self._prepare_value_tokens()
-                except Exception:
-                    pass
-                try:
-                    if getattr(self, '_value_tokens', None) and len(self._value_tokens) > 0:
-                        try:
-                            write_val = int(self._value_tokens.pop(0))
-                        except Exception:
-                            write_val = None
-                except Exception:
-                    write_val = None
-                # update the write_values entry to remove the consumed raw token
-                try:
-                    if getattr(self, '_value_raw_tokens', None):
-                        remaining = self._value_raw_tokens[1:]
-                        try:
-                            self.write_values.set(','.join(remaining))
-                        except Exception:
-                            pass
-                        self._value_raw_tokens = remaining
-                except Exception:
-                    pass
-
-            # pass the consumed write value (may be None) into the simulator so
-            # the cache/core can apply it immediately to cache.block.data.
-            sim.load_sequence([addr], writes=[is_write], values=[write_val])
-            info = sim.step()
-            if info:
-                action = 'W' if info.get('is_write') else 'R'
-                self._append_log(f"Manual {action} Addr {info.get('address')}: {'HIT' if info.get('hit') else 'MISS'}")
-                self._update_stats_widgets(info.get('stats', {}))
-                try:
-                    self.update_cache_display(info)
-                except Exception:
-                    pass
-                # record RAM access (for highlighting) and refresh RAM view when needed
-                try:
-                    mem_read = bool(info.get('mem_read')) if info.get('mem_read') is not None else False
-                    mem_write = bool(info.get('mem_write')) if info.get('mem_write') is not None else False
-                except Exception:
-                    mem_read = False
-                    mem_write = False
-                if mem_read or mem_write:
-                    try:
-                        self._note_ram_access(info.get('address'), info.get('is_write'))
-                    except Exception:
-                        pass
-                try:
-                    self.update_ram_display()
-                except Exception:
-                    pass
-                # update hit-rate history and redraw small chart (same logic as animation step)
-                try:
-                    hr = info.get('stats', {}).get('hit_rate', None)
-                    if hr is None:
-                        s = info.get('stats', {})
-                        accesses = s.get('accesses', 0)
-                        hits = s.get('hits', 0)
-                        hr = (hits / accesses) if accesses else 0.0
-                    self.hit_rate_history.append(hr)
-                    if len(self.hit_rate_history) > 200:
-                        self.hit_rate_history = self.hit_rate_history[-200:]
-                    try:
-                        self._draw_hit_chart()
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
-
-                # If this was a manual write, apply the same consumed write value
-                # to RAM if the simulator indicated an immediate memory write
-                # (write-through) or an eviction write was performed.
-                if is_write:
+                if self._values_dirty:
+                    self._prepare_value_tokens()
+                values = self._value_tokens
+                raw_vals = self._value_raw_tokens
+                for i in range(min(count, len(values))):
+                    write_vals[i], span = values.popleft()
+                    for _ in range(min(span, len(raw_vals))):
+                        raw_vals.popleft()
+
+            # pass the consumed write values (may be None) into the simulator so
+            # the cache/core can apply them immediately to cache.block.data.
+            sim.load_sequence(addrs, writes=[is_write] * count, values=write_vals)
+            infos = []
+            log_lines = []
+            ram = self.ram_obj
+            # bound once; these are called for every access in the batch
+            step = sim.step
+            note = self._note_ram_access
+            push_rate = self.hit_rate_history.append
+            ram_write = ram.write if ram is not None else None
+            mask = self._line_mask
+            line = self._ram_line_size
+            for addr, write_val in zip(addrs, write_vals):
+                info = step()
+                if not info:
+                    break
+                infos.append(info)
+                get = info.get
+                stats = get('stats') or _EMPTY_STATS
+                action = 'W' if get('is_write') else 'R'
+                log_lines.append(f"Manual {action} Addr {get('address')}: {'HIT' if get('hit') else 'MISS'}")
+                # record RAM access (for highlighting)
+                mem_write = bool(get('mem_write'))
+                if mem_write:
+                    # possibly an eviction write-back to another line; the
+                    # coalesced redraw only sees the batch's last info
+                    self._mark_ram_dirty()
+                if mem_write or get('mem_read'):
+                    note(get('address'), get('is_write'))
+                # hit-rate history; the simulator reports the cumulative rate
+                push_rate(stats.get('hit_rate', 0.0))
+                # Only write through to RAM if the simulator performed a memory write
+                # (e.g. write-through policy or an eviction write). For write-back
+                # cases where the block becomes dirty, the RAM write should be
+                # deferred until eviction and therefore we must NOT write here.
+                # write_val was consumed above; nothing is taken from the entry here.
+                if is_write and write_val is not None and ram_write is not None and mem_write:
+                    base = addr & mask if mask is not None else addr - addr % line
                     try:
-                        val = write_val
-                        # Only write through to RAM if the simulator performed a memory write
-                        # (e.g. write-through policy or an eviction write). For write-back
-                        # cases where the block becomes dirty, the RAM write should be
-                        # deferred until eviction and therefore we must NOT write here.
-                        if val is not None and getattr(self, 'ram_obj', None) is not None and bool(mem_write):
-                            try:
-                                line_size = max(1, int(getattr(self.ram_obj, 'line_size', 1)))
-                            except Exception:
-                                line_size = 1
-                            try:
-                                base = (int(addr) // line_size) * line_size
-                            except Exception:
-                                try:
-                                    base = int(addr)
-                                except Exception:
-                                    base = None
-                            try:
-                                if base is not None:
-                                    self.ram_obj.write(base, val)
-                                    # visually note the RAM write
-                                    try:
-                                        self._note_ram_access(base, True)
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                pass
-                        # consume the used raw token from the entry box and update state
-                        try:
-                            if getattr(self, '_value_raw_tokens', None):
-                                remaining = self._value_raw_tokens[1:]
-                                try:
-                                    self.write_values.set(','.join(remaining))
-                                except Exception:
-                                    pass
-                                self._value_raw_tokens = remaining
-                                # reset parsed tokens so future writes reparse
-                                self._value_tokens = []
-                        except Exception:
-                            pass
+                        ram_write(base, write_val)
                     except Exception:
                         pass
-            # update the input box to remove the consumed raw token
-            try:
-                remaining = self._manual_raw_tokens[self._manual_index:]
-                self.input.set(','.join(remaining))
-                # refresh decode preview
-                try:
-                    self.update_decode_panel()
-                except Exception:
-                    pass
-            except Exception:
-                pass
-            # synchronize internal token state with the updated input so future
-            # calls re-parse the newly-typed tokens (prevents "No more manual tokens" when
-            # the input box still shows tokens).
-            try:
-                self._manual_raw_tokens = remaining
-                # clear parsed tokens so _prepare_manual_tokens will re-parse on next consume
-                self._manual_tokens = []
-                self._manual_index = 0
-            except Exception:
-                pass
-            # ensure bindings remain active so further typing is detected
-            try:
-                self._ensure_input_bindings()
-            except Exception:
-                pass
-            return info
+                    else:
+                        # visually note the RAM write
+                        note(base, True)
+
+            if infos:
+                self._append_log('\n'.join(log_lines))
+                # stats, chart and cache/RAM views are redrawn at idle time,
+                # once for any number of accesses made before then
+                self._schedule_manual_redraw(infos[-1])
+            # show the consumed tokens removed from the entries; clicks in
+            # quick succession share one rewrite
+            self._schedule_entry_flush(values=is_write)
+            return infos
         except Exception as e:
             self._append_log(f"Error performing manual access: {e}")
-            return None
+            return []
 
     def read_next(self):
         try:
@@ -3480,6 +3399,21 @@ class UserInterface:
         except Exception:
             pass
 
+    def read_next_batch(self, n: int = None):
+        """Read the next `n` manual tokens in one batch (Shift+Enter).
+
+        `n` defaults to the steps-per-tick setting used by the animation.
+        """
+        if n is None:
+            try:
+                n = max(1, min(MAX_STEPS_PER_TICK, int(self.steps_per_tick.get())))
+            except Exception:
+                n = 1
+        try:
+            self._step_batch(n, is_write=False)
+        except Exception:
+            pass
+
 def run_ui():
     ui = UserInterface()
     ui.start()
@@ -294,3 +294,209 @@ def test_randomized_small_stress():
         is_write = random.random() < 0.35
         res = c.access(a, is_write=is_write)
         assert isinstance(res, tuple)
+
+
+def test_load_sequence_iter_matches_list_path():
+    # Input: Two identical caches Cache(num_blocks=4, associativity=2, line_size=1, write_policy='write-back').
+    # Sequence [0,2,4,0,1] with writes [False,True,False,False,True] repeated for 3 passes;
+    # one simulator uses load_sequence on the materialized lists, the other
+    # load_sequence_iter on a generator with length=15.
+    # Expected: Both simulators yield the same (hit, set_index, way_index, mem_read, mem_write)
+    # for every step and end with identical stats; has_next() is False afterwards.
+    """The lazy iterator path must behave exactly like the list path."""
+    addrs = [0, 2, 4, 0, 1]
+    writes = [False, True, False, False, True]
+    passes = 3
+    sim_list = CacheSimulator(Cache(num_blocks=4, associativity=2, line_size=1, write_policy='write-back'))
+    sim_iter = CacheSimulator(Cache(num_blocks=4, associativity=2, line_size=1, write_policy='write-back'))
+    sim_list.load_sequence(addrs * passes, writes=writes * passes)
+    gen = ((addrs[i], writes[i]) for _ in range(passes) for i in range(len(addrs)))
+    sim_iter.load_sequence_iter(gen, length=len(addrs) * passes)
+    assert sim_iter.sequence_length == 15
+    keys = ('hit', 'set_index', 'way_index', 'mem_read', 'mem_write')
+    steps = 0
+    while sim_list.has_next():
+        assert sim_iter.has_next()
+        a = sim_list.step()
+        b = sim_iter.step()
+        assert tuple(a[k] for k in keys) == tuple(b[k] for k in keys)
+        steps += 1
+    assert steps == 15
+    assert sim_iter.has_next() is False
+    assert sim_iter.step() is None
+    assert sim_iter.stats.hits == sim_list.stats.hits
+    assert sim_iter.stats.memory_writes == sim_list.stats.memory_writes
+
+
+def test_reset_after_load_sequence_iter():
+    # Input: CacheSimulator(Cache(num_blocks=2, associativity=1, line_size=1))
+    # loaded with load_sequence_iter([(0, False), (1, False), (0, False)], length=3);
+    # two steps, then reset(). A second simulator is loaded from a one-shot
+    # generator of the same accesses, stepped once and reset().
+    # Expected: the re-iterable source rewinds: after reset the sequence
+    # starts again at address 0, stats are zeroed and all 3 accesses run
+    # again. The generator cannot be rewound: after reset has_next() is
+    # False and sequence_length is 0.
+    """reset() rewinds a re-iterable lazy sequence and drops a one-shot one."""
+    accesses = [(0, False), (1, False), (0, False)]
+    sim = CacheSimulator(Cache(num_blocks=2, associativity=1, line_size=1))
+    sim.load_sequence_iter(accesses, length=3)
+    sim.step()
+    sim.step()
+    sim.reset()
+    assert sim.sequence_length == 3
+    assert sim.stats.accesses == 0
+    infos = []
+    while sim.has_next():
+        infos.append(sim.step())
+    assert [i['address'] for i in infos] == [0, 1, 0]
+    assert [i['hit'] for i in infos] == [False, False, True]
+
+    one_shot = CacheSimulator(Cache(num_blocks=2, associativity=1, line_size=1))
+    one_shot.load_sequence_iter((a for a in accesses), length=3)
+    one_shot.step()
+    one_shot.reset()
+    assert one_shot.has_next() is False
+    assert one_shot.sequence_length == 0
+    assert one_shot.step() is None
+
+
+def test_ram_read_block_matches_read():
+    # Input: RAM(size_bytes=16, line_size=4) with write(5, 200); read_block(4, 4),
+    # read_block(12, 4), read_block(14, 4) and read_block(0, 0).
+    # Expected: read_block(4, 4) == [read(4), read(5), read(6), read(7)] == [5, 200, 7, 8];
+    # read_block(12, 4) == [13, 14, 15, 16]; read_block(14, 4) raises IndexError
+    # (crosses the end of RAM); read_block(0, 0) == [].
+    """Bulk reads must return the same values as per-address reads."""
+    ram = RAM(size_bytes=16, line_size=4)
+    ram.write(5, 200)
+    assert ram.read_block(4, 4) == [ram.read(a) for a in range(4, 8)] == [5, 200, 7, 8]
+    assert ram.read_block(12, 4) == [13, 14, 15, 16]
+    with pytest.raises(IndexError):
+        ram.read_block(14, 4)
+    assert ram.read_block(0, 0) == []
+
+
+def test_tag_version_tracks_mapping_changes():
+    # Input: Cache(num_blocks=2, associativity=1, line_size=1). Accesses:
+    # access(0) (fill), access(0) (hit), access(0, is_write=True) (write hit),
+    # access(2) (evicts tag 0 in set 0), then reset().
+    # Expected: tag_version starts at 0, becomes 1 after the fill, stays 1
+    # across the read and write hits, becomes 2 after the eviction and 3 after reset.
+    """tag_version must change exactly when some block's (valid, tag) changes."""
+    c = Cache(num_blocks=2, associativity=1, line_size=1)
+    assert c.tag_version == 0
+    c.access(0)
+    assert c.tag_version == 1
+    c.access(0)
+    c.access(0, is_write=True)
+    assert c.tag_version == 1
+    c.access(2)
+    assert c.tag_version == 2
+    c.reset()
+    assert c.tag_version == 3
+
+
+def test_flat_blocks_is_row_major_view_of_sets():
+    # Input: Cache(num_blocks=8, associativity=2, line_size=4), then access(4)
+    # (block_addr 1 -> set 1, fills way 0).
+    # Expected: flat_blocks has 8 entries, flat_blocks[s * 2 + w] is the same
+    # object as sets[s][w] for every set/way, and flat_blocks[2] shows the fill.
+    """flat_blocks must hold the very same block objects as sets, row-major."""
+    c = Cache(num_blocks=8, associativity=2, line_size=4)
+    assert len(c.flat_blocks) == 8
+    for s in range(c.num_sets):
+        for w in range(c.associativity):
+            assert c.flat_blocks[s * c.associativity + w] is c.sets[s][w]
+    c.access(4)
+    assert c.flat_blocks[2].valid and c.flat_blocks[2].tag == 0
+
+
+def test_tag_ways_follows_fills_evictions_and_reset():
+    # Input: Cache(num_blocks=2, associativity=2, line_size=1, replacement='FIFO')
+    # (one set, two ways). Accesses: 0 (fill way 0), 1 (fill way 1),
+    # 2 (evicts tag 0 from way 0), then reset().
+    # Expected: tag_ways[0] is {0: 0} after the first fill, {0: 0, 1: 1}
+    # after the second, {1: 1, 2: 0} after the eviction, and {} after reset;
+    # access(2) after the eviction is a hit in way 0.
+    """tag_ways must map exactly the valid tags of each set to their way."""
+    c = Cache(num_blocks=2, associativity=2, line_size=1, replacement='FIFO')
+    c.access(0)
+    assert c.tag_ways[0] == {0: 0}
+    c.access(1)
+    assert c.tag_ways[0] == {0: 0, 1: 1}
+    c.access(2)
+    assert c.tag_ways[0] == {1: 1, 2: 0}
+    hit, _, way, _, _, _ = c.access(2)
+    assert hit and way == 0
+    c.reset()
+    assert c.tag_ways[0] == {}
+
+
+def test_find_way_locates_valid_tags_only():
+    # Input: Cache(num_blocks=4, associativity=2, line_size=2) (two sets);
+    # write address 6, i.e. block 3 -> set 1, tag 1.
+    # Expected: decode(6) == (1, 1); find_way(1, 1) is the way reported by
+    # the access; find_way(0, 1) and find_way(1, 0) are None, and so is
+    # find_way(1, 1) after reset().
+    """find_way answers from the per-set tag index the UI uses for lookups."""
+    c = Cache(num_blocks=4, associativity=2, line_size=2)
+    _, set_index, way, _, _, _ = c.access(6, is_write=True)
+    assert c.decode(6) == (set_index, 1) == (1, 1)
+    assert c.find_way(1, 1) == way
+    assert c.find_way(0, 1) is None
+    assert c.find_way(1, 0) is None
+    c.reset()
+    assert c.find_way(1, 1) is None
+
+
+def test_dirty_count_tracks_dirty_blocks():
+    # Input: Cache(num_blocks=2, associativity=1, line_size=1, write_policy='write-back').
+    # Accesses: access(0, is_write=True) (dirty fill), access(0, is_write=True)
+    # (write hit on the dirty line), access(1) (clean fill), access(2) (evicts
+    # dirty tag 0 with a clean read fill), then set_dirty on set 1 and reset().
+    # Expected: dirty_count is 1, 1, 1, 0, 1 after those steps and 0 after reset.
+    """dirty_count must equal the number of blocks with dirty set."""
+    c = Cache(num_blocks=2, associativity=1, line_size=1, write_policy='write-back')
+    c.access(0, is_write=True)
+    assert c.dirty_count == 1
+    c.access(0, is_write=True)
+    assert c.dirty_count == 1
+    c.access(1)
+    assert c.dirty_count == 1
+    c.access(2)
+    assert c.dirty_count == 0
+    c.set_dirty(c.sets[1][0], True)
+    assert c.dirty_count == sum(b.dirty for b in c.flat_blocks) == 1
+    c.reset()
+    assert c.dirty_count == 0
+
+
+def test_step_stats_report_cumulative_hit_rate():
+    # Input: Cache(num_blocks=2, associativity=1, line_size=1), CacheSimulator
+    # without RAM; reads of addresses [0, 0, 1, 0] stepped one by one.
+    # Expected: each step's info['stats']['hit_rate'] equals hits / accesses
+    # so far: 0.0, 0.5, 1/3, 0.5.
+    """The UI takes the hit-rate history straight from step stats, so every
+    step must report the cumulative hit rate.
+    """
+    sim = CacheSimulator(Cache(num_blocks=2, associativity=1, line_size=1))
+    sim.load_sequence([0, 0, 1, 0])
+    rates = [sim.step()['stats']['hit_rate'] for _ in range(4)]
+    assert rates == pytest.approx([0.0, 0.5, 1 / 3, 0.5])
+
+
+@pytest.mark.parametrize("nb, assoc, ls", [(16, 2, 4), (8, 1, 8), (12, 1, 3), (6, 1, 4), (12, 2, 2)])
+def test_decode_matches_division_for_all_geometries(nb, assoc, ls):
+    # Input: Cache(num_blocks=nb, associativity=assoc, line_size=ls) for
+    # power-of-two and non-power-of-two line sizes / set counts; decode of
+    # every address in 0..255.
+    # Expected: (set_index, tag) equals (block % num_sets, block // num_sets)
+    # with block = address // line_size.
+    """decode splits power-of-two geometries with shifts and masks and
+    divides otherwise; both paths must agree with plain division.
+    """
+    c = Cache(num_blocks=nb, associativity=assoc, line_size=ls)
+    for addr in range(256):
+        block = addr // c.line_size
+        assert c.decode(addr) == (block % c.num_sets, block // c.num_sets)